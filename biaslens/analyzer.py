@@ -4,8 +4,9 @@ from .emotion import EmotionClassifier
 from .bias import BiasLensAnalyzer as NewBiasLensAnalyzer # New import
 from .patterns import NigerianPatterns, FakeNewsDetector, ViralityDetector
 from .trust import TrustScoreCalculator
+from .utils import limit_torch_threads, shared_executor
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import logging
 import random # Added for random tip selection
 
@@ -18,8 +19,13 @@ class BiasLensAnalyzer:
     Provides a unified interface for comprehensive news bias and manipulation detection.
     """
 
-    def __init__(self):
-        """Initialize all analysis components with lazy loading"""
+    def __init__(self, concurrent_models: bool = False):
+        """Initialize all analysis components with lazy loading
+
+        With concurrent_models=True the sentiment, emotion and bias models of a multi-text
+        batch run side by side on a shared pool, with torch's threads split between them.
+        """
+        self.concurrent_models = concurrent_models
         self._sentiment_analyzer = None
         self._emotion_classifier = None
         # self._bias_detector = None
@@ -81,27 +87,74 @@ class BiasLensAnalyzer:
         Comprehensive analysis of text for bias, manipulation, and trustworthiness.
         New "Core Solution" based output structure.
         """
-        # Default structure for error returns, matching the new "Core Solution" structure
-        default_error_payload = {
+        return self.analyse_batch([text], include_patterns, [headline], include_detailed_results)[0]
+
+    def analyse_batch(self, texts: List[str], include_patterns: bool = True,
+                      headlines: Optional[List[Optional[str]]] = None,
+                      include_detailed_results: bool = False) -> List[Dict]:
+        """
+        Analyse many texts at once. Each transformer model runs one padded batch over all
+        texts; the models run one after another unless concurrent_models was requested.
+        """
+        if headlines is None:
+            headlines = [None] * len(texts)
+
+        results: List[Optional[Dict]] = [None] * len(texts)
+        valid_indices = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = {
+                    **self._error_payload(),
+                    'explanation': ["Empty or invalid text provided."],
+                    'tip': "Analysis failed: No text was provided. Please input text for analysis."
+                }
+            else:
+                valid_indices.append(i)
+
+        if not valid_indices:
+            return results
+
+        valid_texts = [texts[i] for i in valid_indices]
+
+        valid_headlines = [headlines[i] for i in valid_indices]
+
+        # --- Stage 1: Run the model-backed analyses ---
+        if self.concurrent_models and len(valid_texts) > 1:
+            # torch releases the GIL, so the three models overlap; each gets a third of the cores
+            limit_torch_threads(3)
+            executor = shared_executor("analyzer-models", 3)
+            sentiment_future = executor.submit(self._analyze_sentiment_batch_safe, valid_texts, valid_headlines)
+            emotion_future = executor.submit(self._analyze_emotion_batch_safe, valid_texts)
+            bias_future = executor.submit(self._analyze_bias_batch_safe, valid_texts)
+            sentiment_results = sentiment_future.result()
+            emotion_results = emotion_future.result()
+            bias_results = bias_future.result()
+        else:
+            sentiment_results = self._analyze_sentiment_batch_safe(valid_texts, valid_headlines)
+            emotion_results = self._analyze_emotion_batch_safe(valid_texts)
+            bias_results = self._analyze_bias_batch_safe(valid_texts)
+
+        for k, i in enumerate(valid_indices):
+            results[i] = self._assemble_analysis(
+                texts[i], include_patterns, include_detailed_results,
+                sentiment_results[k], emotion_results[k], bias_results[k]
+            )
+        return results
+
+    @staticmethod
+    def _error_payload() -> Dict:
+        """Default structure for error returns, matching the new "Core Solution" structure"""
+        return {
             'trust_score': None, 'indicator': 'Error', 'explanation': None, 'tip': None,
             'tone_analysis': None, 'bias_analysis': None, 'manipulation_analysis': None,
             'veracity_signals': None, 'lightweight_nigerian_bias_assessment': None,
             'detailed_sub_analyses': None # Ensure detailed_sub_analyses is also None in error cases
         }
 
-        if not text or not text.strip():
-            return {
-                **default_error_payload,
-                'explanation': ["Empty or invalid text provided."],
-                'tip': "Analysis failed: No text was provided. Please input text for analysis."
-            }
-
+    def _assemble_analysis(self, text: str, include_patterns: bool, include_detailed_results: bool,
+                           sentiment_result: Dict, emotion_result: Dict, bias_result_ml: Dict) -> Dict:
+        """Run the rule-based stages for one text and build the final response"""
         try:
-            # --- Stage 1: Perform all individual analyses ---
-            sentiment_result = self._analyze_sentiment_safe(text, headline)
-            emotion_result = self._analyze_emotion_safe(text)
-            bias_result_ml = self._analyze_bias_safe(text) # ML-based bias detection
-
             pattern_result = {}
             pattern_result = {}
             lightweight_nigerian_bias_info = {} # Initialize here
@@ -112,8 +165,9 @@ class BiasLensAnalyzer:
                 lightweight_nigerian_bias_info = {
                     "count": len(nd),
                     "inferred_bias_type": nd[0]['category'] if nd and isinstance(nd, list) and len(nd) > 0 and isinstance(nd[0], dict) else "No specific patterns detected",
-                    "categories_present": list(set(d.get('category') for d in nd if isinstance(d, dict) and d.get('category'))),
-                    "matched_keywords": list(set(d.get('term') for d in nd if isinstance(d, dict) and d.get('term')))[:3],
+                    # dict.fromkeys dedupes while keeping the confidence ranking of the detections
+                    "categories_present": list(dict.fromkeys(d.get('category') for d in nd if isinstance(d, dict) and d.get('category'))),
+                    "matched_keywords": list(dict.fromkeys(d.get('term') for d in nd if isinstance(d, dict) and d.get('term')))[:3],
                     "has_specific_nigerian_bias": bool(nd)
                 }
 
@@ -222,7 +276,7 @@ class BiasLensAnalyzer:
         except Exception as e:
             logger.error(f"Analysis failed due to an unexpected error: {str(e)}", exc_info=True)
             return {
-                **default_error_payload,
+                **self._error_payload(),
                 'explanation': [f"An error occurred during analysis: {str(e)}"],
                 'tip': "Analysis failed due to an unexpected error. Please try again later or contact support."}
     def analyze_headline_content_mismatch(self, headline: str, content: str) -> Dict:
@@ -298,10 +352,23 @@ class BiasLensAnalyzer:
 
     def _analyze_sentiment_safe(self, text: str, headline: Optional[str] = None) -> Dict:
         """Sentiment analysis with error handling"""
+        return self._analyze_sentiment_batch_safe([text], [headline])[0]
+
+    def _analyze_sentiment_batch_safe(self, texts: List[str], headlines: List[Optional[str]]) -> List[Dict]:
+        """Batched sentiment analysis with error handling"""
         try:
-            result = self.sentiment_analyzer.analyze(text)
+            results = self.sentiment_analyzer.analyze_batch(texts)
+        except Exception as e:
+            logger.error(f"Sentiment analysis failed: {str(e)}")
+            return [{
+                'label': 'neutral',
+                'confidence': 0.0,
+                'error': f"Sentiment analysis failed: {str(e)}",
+                'all_scores': {'negative': 0.33, 'neutral': 0.34, 'positive': 0.33}
+            } for _ in texts]
 
-            # Add headline comparison if provided - with error handling
+        # Add headline comparison if provided - with error handling
+        for text, headline, result in zip(texts, headlines, results):
             if headline and headline.strip():
                 try:
                     headline_comparison = self.sentiment_analyzer.analyze_headline_vs_content(
@@ -314,78 +381,93 @@ class BiasLensAnalyzer:
                         'error': f"Headline comparison failed: {str(e)}"
                     }
 
-            return result
-
-        except Exception as e:
-            logger.error(f"Sentiment analysis failed: {str(e)}")
-            return {
-                'label': 'neutral',
-                'confidence': 0.0,
-                'error': f"Sentiment analysis failed: {str(e)}",
-                'all_scores': {'negative': 0.33, 'neutral': 0.34, 'positive': 0.33}
-            }
+        return results
 
     def _analyze_emotion_safe(self, text: str) -> Dict:
         """Emotion analysis with error handling"""
+        return self._analyze_emotion_batch_safe([text])[0]
+
+    def _analyze_emotion_batch_safe(self, texts: List[str]) -> List[Dict]:
+        """Batched emotion analysis with error handling"""
         try:
-            return self.emotion_classifier.classify(text)
+            return self.emotion_classifier.classify_batch(texts)
         except Exception as e:
             logger.error(f"Emotion analysis failed: {str(e)}")
-            return {
+            return [{
                 'label': 'neutral',
                 'confidence': 0.0,
                 'error': f"Emotion analysis failed: {str(e)}",
                 'manipulation_risk': 'unknown',
                 'is_emotionally_charged': False
-            }
+            } for _ in texts]
 
     def _analyze_bias_safe(self, text: str) -> Dict:
         """Bias analysis with error handling using the new NewBiasLensAnalyzer"""
+        return self._analyze_bias_batch_safe([text])[0]
+
+    def _analyze_bias_batch_safe(self, texts: List[str]) -> List[Dict]:
+        """Batched bias analysis with error handling using the new NewBiasLensAnalyzer"""
         try:
-            result = self.new_bias_analyzer.analyze(text)
+            raw_results = self.new_bias_analyzer.analyze_batch(texts)
+        except Exception as e:
+            logger.error(f"New bias analysis failed: {str(e)}", exc_info=True)
+            return [self._bias_error_result(e) for _ in texts]
 
-            # Adapt the new structure to the expected old structure for now
-            # Expected: {'flag', 'label', 'type_analysis', 'confidence', 'bias_level', 'nigerian_detections', 'detected'}
+        results = []
+        for result in raw_results:
+            try:
+                results.append(self._adapt_bias_result(result))
+            except Exception as e:
+                logger.error(f"New bias analysis failed: {str(e)}", exc_info=True)
+                results.append(self._bias_error_result(e))
+        return results
 
-            overall_bias = result.get('overall_bias', {})
-            bias_details = result.get('bias_details', {})
+    @staticmethod
+    def _adapt_bias_result(result: Dict) -> Dict:
+        """Adapt the new analyzer's report to the structure the rest of the pipeline expects"""
+        # Adapt the new structure to the expected old structure for now
+        # Expected: {'flag', 'label', 'type_analysis', 'confidence', 'bias_level', 'nigerian_detections', 'detected'}
 
-            flag = overall_bias.get('is_biased', False)
-            level = overall_bias.get('level') # 'high', 'medium', 'low'
+        overall_bias = result.get('overall_bias', {})
+        bias_details = result.get('bias_details', {})
 
-            label = f"Potentially Biased ({level})" if flag and level else \
-                    ("No Bias Detected" if not flag else "Bias Analysis Inconclusive")
+        flag = overall_bias.get('is_biased', False)
+        level = overall_bias.get('level') # 'high', 'medium', 'low'
 
-            type_analysis = {
-                'type': bias_details.get('type'),
-                'confidence': bias_details.get('type_confidence'),
-                'nigerian_context': bias_details.get('nigerian_context')
-            }
+        label = f"Potentially Biased ({level})" if flag and level else \
+                ("No Bias Detected" if not flag else "Bias Analysis Inconclusive")
 
-            return {
-                'flag': flag,
-                'label': label,
-                'type_analysis': type_analysis,
-                'confidence': overall_bias.get('confidence'),
-                'bias_level': level,
-                'nigerian_detections': bias_details.get('specific_detections', []),
-                'detected': flag, # a.k.a. is_biased
-                # Store the full new result as well, for potential future use or if other parts need more details
-                'raw_new_analyzer_result': result
-            }
+        type_analysis = {
+            'type': bias_details.get('type'),
+            'confidence': bias_details.get('type_confidence'),
+            'nigerian_context': bias_details.get('nigerian_context')
+        }
 
-        except Exception as e:
-            logger.error(f"New bias analysis failed: {str(e)}", exc_info=True)
-            return {
-                'flag': False,
-                'label': "Bias analysis failed",
-                'type_analysis': {'type': 'analysis_error', 'confidence': 0.0},
-                'confidence': 0.0,
-                'bias_level': 'unknown',
-                'nigerian_detections': [],
-                'detected': False,
-                'error': f"New bias analysis failed: {str(e)}"
-            }
+        return {
+            'flag': flag,
+            'label': label,
+            'type_analysis': type_analysis,
+            'confidence': overall_bias.get('confidence'),
+            'bias_level': level,
+            'nigerian_detections': bias_details.get('specific_detections', []),
+            'detected': flag, # a.k.a. is_biased
+            # Store the full new result as well, for potential future use or if other parts need more details
+            'raw_new_analyzer_result': result
+        }
+
+    @staticmethod
+    def _bias_error_result(error: Exception) -> Dict:
+        """Fallback bias result when the new analyzer fails"""
+        return {
+            'flag': False,
+            'label': "Bias analysis failed",
+            'type_analysis': {'type': 'analysis_error', 'confidence': 0.0},
+            'confidence': 0.0,
+            'bias_level': 'unknown',
+            'nigerian_detections': [],
+            'detected': False,
+            'error': f"New bias analysis failed: {str(error)}"
+        }
 
     def _analyze_patterns_safe(self, text: str) -> Dict:
         """Pattern analysis with error handling - IMPROVED"""
@@ -453,10 +535,10 @@ class BiasLensAnalyzer:
                 'indicator': indicator,
                 'explanation': explanation,
                 'tip': tip,
-                'trust_level': extras.get('trust_level', 'unknown'),
-                'risk_factors': extras.get('risk_factors', []),
-                'summary': extras.get('summary', ''),
-                'pattern_analysis': extras.get('pattern_analysis', {})
+                'trust_level': extras.trust_level,
+                'risk_factors': extras.risk_factors,
+                'summary': extras.summary,
+                'pattern_analysis': extras.pattern_analysis._asdict()
             }
 
         except Exception as e:
@@ -578,7 +660,9 @@ class BiasLensAnalyzer:
         """Generate human-readable overall assessment"""
 
         trust_score = trust_result.get('score', 50)
-        risk_factors = trust_result.get('risk_factors', [])
+        risk_factors = set(trust_result.get('risk_factors', ()))
+        has_clickbait = 'clickbait' in risk_factors
+        has_fake_risk = not risk_factors.isdisjoint(('high_fake_risk', 'medium_fake_risk', 'low_fake_risk'))
 
         # Determine primary concerns
         primary_concerns = []
@@ -598,10 +682,10 @@ class BiasLensAnalyzer:
         if is_emotionally_manipulative:
             primary_concerns.append("Uses language that may be emotionally manipulative.")
 
-        if 'clickbait' in str(risk_factors).lower(): # Ensure case-insensitivity
+        if has_clickbait:
             primary_concerns.append("Shows characteristics of clickbait.")
 
-        if 'fake_risk' in str(risk_factors).lower(): # Ensure case-insensitivity
+        if has_fake_risk:
             primary_concerns.append("Contains elements associated with misinformation.")
 
         # Consolidate if too many generic concerns, but for now, let's keep them distinct as requested.
@@ -621,9 +705,9 @@ class BiasLensAnalyzer:
             educational_tip = f"Learn more about {bias_type_detected} Bias: Understand its common characteristics and how it can influence perception. Look for signs like selective reporting or emotionally loaded framing related to this bias."
         elif is_emotionally_manipulative:
             educational_tip = "Recognize emotionally manipulative language: Pay attention to words designed to evoke strong emotional responses (e.g., 'outrageous,' 'shocking,' 'miraculous'). Such language can overshadow factual reporting. Question if the emotion is justified by the evidence."
-        elif 'clickbait' in str(risk_factors).lower():
+        elif has_clickbait:
             educational_tip = "Identify clickbait: Watch out for sensationalized headlines or teasers that withhold key information to provoke clicks. Compare the headline with the actual content to see if it delivers on its promise."
-        elif 'fake_risk' in str(risk_factors).lower():
+        elif has_fake_risk:
             educational_tip = "Spotting misinformation: Look for unverifiable claims, anonymous sources, or a lack of credible evidence. Check if other reputable sources are reporting the same information."
 
         # Risk level
@@ -637,7 +721,7 @@ class BiasLensAnalyzer:
         return {
             'trust_score': trust_score,
             'risk_level': risk_level,
-            'primary_concerns': list(set(primary_concerns)), # Ensure distinct concerns
+            'primary_concerns': list(dict.fromkeys(primary_concerns)), # Ensure distinct concerns (in detection order)
             'recommendation': recommendation,
             'summary': trust_result.get('summary', ''),
             'educational_tip': educational_tip
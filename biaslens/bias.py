@@ -1,11 +1,29 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-from .utils import _model_cache
+from transformers import AutoModel, AutoModelForSequenceClassification, pipeline
+import torch
+import torch.nn.functional as F
+from .utils import (
+    ResultCache, _analyzer_cache, get_or_load_model, int8_enabled, limit_torch_threads, load_fast_tokenizer,
+    load_onnx_classifier, quantize_dynamic_int8, shared_executor
+)
+import copy
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import wait
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 
+_NON_WORD_RE = re.compile(r'[^\w]')
+_by_confidence = attrgetter('confidence')
+# Distance weight for sentiment words near a term: max(0.1, 1.0 - 0.15 * distance),
+# tabulated for the distances where it is above the 0.1 floor
+_DISTANCE_WEIGHTS = tuple(max(0.1, 1.0 - (distance * 0.15)) for distance in range(7))
+
+
 class BiasLevel(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -21,8 +39,11 @@ class BiasCategory(Enum):
     SOCIAL = "social"
 
 
-@dataclass
+@dataclass(frozen=True)
 class BiasDetection:
+    # Immutable and __dict__-free: detections are shared through the analyzer's result cache
+    __slots__ = ("term", "category", "bias_level", "confidence", "context", "bias_direction", "explanation")
+    
     term: str
     category: BiasCategory
     bias_level: BiasLevel
@@ -32,7 +53,7 @@ class BiasDetection:
     explanation: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class ContextualPattern:
     term: str
     neutral_contexts: List[str]
@@ -43,7 +64,12 @@ class ContextualPattern:
 class NigerianContextAnalyzer:
     """Enhanced Nigerian context analyzer with false positive reduction"""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 2048):
+        # analyze_text is deterministic, so repeated texts (retries, ensembles) are served
+        # from a small per-instance LRU; cache_size=0 disables it
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, List[BiasDetection]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         # Context-aware patterns to reduce false positives
         self.contextual_patterns = {
             BiasCategory.POLITICAL: {
@@ -197,44 +223,101 @@ class NigerianContextAnalyzer:
                               "exceptional", "perfect", "best", "love", "support"]
         }
 
-    def analyze_text(self, text: str) -> List[BiasDetection]:
+        # Flat word -> polarity weight table for _calculate_sentiment_score. setdefault in
+        # strongest-negative-first order keeps the original if/elif precedence.
+        self._sentiment_weights: Dict[str, float] = {}
+        for level, polarity in (("strong_negative", -1.0), ("moderate_negative", -0.6),
+                                ("mild_negative", -0.3), ("mild_positive", 0.3),
+                                ("moderate_positive", 0.6), ("strong_positive", 1.0)):
+            for word in self.sentiment_indicators[level]:
+                self._sentiment_weights.setdefault(word, polarity)
+
+        # Flat (term, category, pattern) table in declaration order, plus term -> positions in it,
+        # so a match maps straight to its patterns without walking the nested dicts
+        self._all_patterns: Tuple[Tuple[str, BiasCategory, ContextualPattern], ...] = tuple(
+            (term, category, pattern)
+            for category, patterns in self.contextual_patterns.items()
+            for term, pattern in patterns.items()
+        )
+        self._term_to_indices: Dict[str, List[int]] = {}
+        for index, (term, _, _) in enumerate(self._all_patterns):
+            self._term_to_indices.setdefault(term, []).append(index)
+
+        # Single alternation over every term so one regex pass finds all candidates.
+        # Longest terms first so multi-word terms like "labour party" win over shorter ones.
+        all_terms = sorted(
+            (term for patterns in self.contextual_patterns.values() for term in patterns),
+            key=len, reverse=True
+        )
+        self._term_pattern = re.compile(r'\b(?:' + '|'.join(re.escape(t) for t in all_terms) + r')\b')
+
+        # The tables are never modified after construction; expose them read-only so one
+        # instance can safely be shared (see get())
+        self.contextual_patterns = MappingProxyType({
+            category: MappingProxyType(patterns) for category, patterns in self.contextual_patterns.items()
+        })
+        self.sentiment_indicators = MappingProxyType(self.sentiment_indicators)
+
+    @classmethod
+    def get(cls) -> "NigerianContextAnalyzer":
+        """Return the process-wide shared analyzer, building it on first use"""
+        analyzer = _analyzer_cache.get(cls)
+        if analyzer is None:
+            analyzer = _analyzer_cache.setdefault(cls, cls())
+        return analyzer
+
+    def analyze_text(self, text: str, text_lower: Optional[str] = None) -> List[BiasDetection]:
         """Main analysis method with comprehensive bias detection"""
-        text_lower = text.lower()
-        detections = []
+        if self.cache_size <= 0:
+            return self._analyze_uncached(text, text_lower)
         
-        # Check each category
-        for category, patterns in self.contextual_patterns.items():
-            category_detections = self._analyze_category(text_lower, text, category, patterns)
-            detections.extend(category_detections)
+        with self._cache_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return list(cached)
         
-        # Remove duplicates and rank by confidence
-        detections = self._deduplicate_and_rank(detections)
-        
-        return detections
+        detections = self._analyze_uncached(text, text_lower)
+        with self._cache_lock:
+            self._cache[text] = detections
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return list(detections)
 
-    def _analyze_category(self, text_lower: str, original_text: str, category: BiasCategory, 
-                         patterns: Dict[str, ContextualPattern]) -> List[BiasDetection]:
-        """Analyze text for a specific bias category"""
+    def _analyze_uncached(self, text: str, text_lower: Optional[str] = None) -> List[BiasDetection]:
+        """Run the full term scan and context analysis for one text"""
+        if text_lower is None:
+            text_lower = text.lower()
         detections = []
         
-        for term, pattern in patterns.items():
-            if self._term_exists_in_text(text_lower, term):
-                detection = self._analyze_term_context(
-                    text_lower, original_text, term, pattern, category
-                )
-                if detection:
-                    detections.append(detection)
+        # Find every term present in a single regex pass
+        found_terms = {m.group(0) for m in self._term_pattern.finditer(text_lower)}
+        if not found_terms:
+            # Nothing to analyze: skip tokenizing and the per-category sweep
+            return []
+        
+        # Tokenize once and locate each term once; every context window below is sliced
+        # from this list around that position
+        words = text_lower.split()
+        term_positions = {term: self._term_position(words, term) for term in found_terms}
+        
+        # Only the matched terms are analyzed, in declaration order so ranking ties stay stable
+        all_patterns = self._all_patterns
+        for index in sorted(i for term in found_terms for i in self._term_to_indices[term]):
+            term, category, pattern = all_patterns[index]
+            detection = self._analyze_term_context(
+                text_lower, words, term_positions[term], text, term, pattern, category
+            )
+            if detection:
+                detections.append(detection)
+        
+        # Remove duplicates and rank by confidence
+        detections = self._deduplicate_and_rank(detections)
         
         return detections
 
-    def _term_exists_in_text(self, text: str, term: str) -> bool:
-        """Check if term exists with word boundary consideration"""
-        # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(term) + r'\b'
-        return bool(re.search(pattern, text, re.IGNORECASE))
-
-    def _analyze_term_context(self, text_lower: str, original_text: str, term: str, 
-                            pattern: ContextualPattern, category: BiasCategory) -> Optional[BiasDetection]:
+    def _analyze_term_context(self, text_lower: str, words: List[str], term_pos: Optional[int], original_text: str,
+                            term: str, pattern: ContextualPattern, category: BiasCategory) -> Optional[BiasDetection]:
         """Analyze the context around a detected term"""
         
         # For terms that don't require context (slurs), always flag as biased
@@ -244,47 +327,57 @@ class NigerianContextAnalyzer:
                 category=category,
                 bias_level=BiasLevel.HIGH,
                 confidence=0.95,
-                context=self._extract_context(text_lower, term),
+                context=self._extract_context(words, term_pos),
                 bias_direction="negative",
                 explanation=f"Contains derogatory term '{term}' which is inherently biased"
             )
         
-        # Check for neutral contexts first
-        for neutral_context in pattern.neutral_contexts:
-            if neutral_context in text_lower:
-                # Even in neutral context, check for bias indicators
-                context_window = self._extract_context(text_lower, term, window_size=10)
-                bias_score, direction = self._calculate_sentiment_score(context_window, term)
-                
-                if abs(bias_score) < 0.3:  # Truly neutral
-                    return None
-                elif abs(bias_score) < 0.6:  # Mild bias in neutral context
-                    return BiasDetection(
-                        term=term,
-                        category=category,
-                        bias_level=BiasLevel.LOW,
-                        confidence=0.4,
-                        context=context_window,
-                        bias_direction=direction,
-                        explanation=f"Mild bias detected around '{term}' despite neutral context"
-                    )
+        # Sentiment words around the term are collected once; the 10-word neutral check and the
+        # 8-word general check below both score from the same hits
+        hits = None
         
-        # Check for explicitly biased contexts
-        for biased_context in pattern.biased_contexts:
-            if biased_context in text_lower:
+        # Check for neutral contexts first; the score does not depend on which one matched,
+        # so it is computed at most once
+        if any(neutral_context in text_lower for neutral_context in pattern.neutral_contexts):
+            # Even in neutral context, check for bias indicators
+            hits = self._sentiment_hits(words, term_pos, window_size=10)
+            window_words = self._context_window(words, term_pos, window_size=10)
+            bias_score, direction = self._calculate_sentiment_score(hits, 10, len(window_words))
+            
+            if abs(bias_score) < 0.3:  # Truly neutral
+                return None
+            elif abs(bias_score) < 0.6:  # Mild bias in neutral context
                 return BiasDetection(
                     term=term,
                     category=category,
-                    bias_level=BiasLevel.HIGH,
-                    confidence=0.9,
-                    context=self._extract_context(text_lower, term),
-                    bias_direction="negative",
-                    explanation=f"Explicitly biased language: '{biased_context}'"
+                    bias_level=BiasLevel.LOW,
+                    confidence=0.4,
+                    context=" ".join(window_words),
+                    bias_direction=direction,
+                    explanation=f"Mild bias detected around '{term}' despite neutral context"
                 )
         
+        # Check for explicitly biased contexts
+        biased_context = next(
+            (context for context in pattern.biased_contexts if context in text_lower), None
+        )
+        if biased_context is not None:
+            return BiasDetection(
+                term=term,
+                category=category,
+                bias_level=BiasLevel.HIGH,
+                confidence=0.9,
+                context=self._extract_context(words, term_pos),
+                bias_direction="negative",
+                explanation=f"Explicitly biased language: '{biased_context}'"
+            )
+        
         # General context analysis
-        context_window = self._extract_context(text_lower, term, window_size=8)
-        bias_score, direction = self._calculate_sentiment_score(context_window, term)
+        if hits is None:
+            hits = self._sentiment_hits(words, term_pos, window_size=8)
+        window_words = self._context_window(words, term_pos, window_size=8)
+        bias_score, direction = self._calculate_sentiment_score(hits, 8, len(window_words))
+        context_window = " ".join(window_words)
         
         if abs(bias_score) >= 0.7:
             return BiasDetection(
@@ -309,56 +402,54 @@ class NigerianContextAnalyzer:
         
         return None
 
-    def _extract_context(self, text: str, term: str, window_size: int = 6) -> str:
-        """Extract context window around the term"""
-        words = text.split()
-        term_positions = [i for i, word in enumerate(words) if term in word.lower()]
-        
-        if not term_positions:
-            return ""
-        
-        # Use the first occurrence for context
-        pos = term_positions[0]
-        start = max(0, pos - window_size)
-        end = min(len(words), pos + window_size + 1)
+    @staticmethod
+    def _term_position(words: List[str], term: str) -> Optional[int]:
+        """Index of the first word containing the term, or None"""
+        return next((i for i, word in enumerate(words) if term in word), None)
+
+    def _context_window(self, words: List[str], term_pos: Optional[int], window_size: int = 6) -> List[str]:
+        """Slice the words within window_size of the term"""
+        if term_pos is None:
+            return []
         
-        return " ".join(words[start:end])
+        return words[max(0, term_pos - window_size):term_pos + window_size + 1]
 
-    def _calculate_sentiment_score(self, context: str, target_term: str) -> Tuple[float, str]:
-        """Calculate sentiment score for the context around target term"""
-        words = context.lower().split()
-        score = 0.0
+    def _extract_context(self, words: List[str], term_pos: Optional[int], window_size: int = 6) -> str:
+        """Extract context window around the term from the pre-split, lowercased words"""
+        return " ".join(self._context_window(words, term_pos, window_size))
+
+    def _sentiment_hits(self, words: List[str], term_pos: Optional[int], window_size: int) -> List[Tuple[int, float]]:
+        """(distance from term, weighted polarity) of each sentiment word within window_size, left to right"""
+        if term_pos is None:
+            return []
         
-        # Weight sentiment words by distance from target term
-        target_positions = [i for i, word in enumerate(words) if target_term in word]
+        sentiment_weights = self._sentiment_weights
+        start = max(0, term_pos - window_size)
+        hits = []
         
-        if not target_positions:
-            return 0.0, "neutral"
+        for i, word in enumerate(words[start:term_pos + window_size + 1], start):
+            # Clean word of punctuation
+            polarity = sentiment_weights.get(_NON_WORD_RE.sub('', word))
+            if polarity is not None:
+                # Closer words have higher weight
+                distance = abs(i - term_pos)
+                weight = _DISTANCE_WEIGHTS[distance] if distance < len(_DISTANCE_WEIGHTS) else 0.1
+                hits.append((distance, polarity * weight))
         
-        target_pos = target_positions[0]
+        return hits
+
+    def _calculate_sentiment_score(self, hits: List[Tuple[int, float]], window_size: int,
+                                   window_length: int) -> Tuple[float, str]:
+        """Calculate sentiment score from the hits within window_size words of the target term"""
+        score = 0.0
         
-        for i, word in enumerate(words):
-            distance = abs(i - target_pos)
-            weight = max(0.1, 1.0 - (distance * 0.15))  # Closer words have higher weight
-            
-            # Clean word of punctuation
-            clean_word = re.sub(r'[^\w]', '', word)
-            
-            if clean_word in self.sentiment_indicators["strong_negative"]:
-                score -= 1.0 * weight
-            elif clean_word in self.sentiment_indicators["moderate_negative"]:
-                score -= 0.6 * weight
-            elif clean_word in self.sentiment_indicators["mild_negative"]:
-                score -= 0.3 * weight
-            elif clean_word in self.sentiment_indicators["mild_positive"]:
-                score += 0.3 * weight
-            elif clean_word in self.sentiment_indicators["moderate_positive"]:
-                score += 0.6 * weight
-            elif clean_word in self.sentiment_indicators["strong_positive"]:
-                score += 1.0 * weight
+        # Hits are already weighted by distance from the target term
+        for distance, weighted_polarity in hits:
+            if distance <= window_size:
+                score += weighted_polarity
         
         # Normalize by context length
-        normalized_score = score / max(len(words), 1)
+        normalized_score = score / max(window_length, 1)
         
         if normalized_score < -0.1:
             return normalized_score, "negative"
@@ -369,53 +460,152 @@ class NigerianContextAnalyzer:
 
     def _deduplicate_and_rank(self, detections: List[BiasDetection]) -> List[BiasDetection]:
         """Remove duplicates and rank by confidence"""
-        # Remove duplicates based on term and category
-        seen = set()
-        unique_detections = []
+        # Keep the most confident detection per term and category in a single pass
+        best: Dict[Tuple[str, BiasCategory], BiasDetection] = {}
         
         for detection in detections:
             key = (detection.term, detection.category)
-            if key not in seen:
-                seen.add(key)
-                unique_detections.append(detection)
+            current = best.get(key)
+            if current is None or detection.confidence > current.confidence:
+                best[key] = detection
         
         # Sort by confidence (highest first)
-        return sorted(unique_detections, key=lambda x: x.confidence, reverse=True)
+        return sorted(best.values(), key=_by_confidence, reverse=True)
 
 
 class EnhancedBiasDetector:
     """Enhanced bias detector with Nigerian context awareness"""
     
-    def __init__(self, model_name="martin-ha/toxic-comment-model", threshold=0.5):
-        # Load base model
-        if model_name not in _model_cache:
-            tokenizer = AutoTokenizer.from_pretrained(model_name)
-            model = AutoModelForSequenceClassification.from_pretrained(model_name)
-            pipe = pipeline("text-classification", model=model, tokenizer=tokenizer)
-            _model_cache[model_name] = {
-                "tokenizer": tokenizer,
-                "model": model,
-                "pipeline": pipe
-            }
-        
-        self.pipeline = _model_cache[model_name]["pipeline"]
+    # Per-detection boost (in tenths) for high-confidence Nigerian detections
+    _BOOST_TENTHS = {BiasLevel.HIGH: 3, BiasLevel.MEDIUM: 2, BiasLevel.LOW: 1}
+    _MAX_BOOST_TENTHS = 4
+    
+    def __init__(self, model_name="martin-ha/toxic-comment-model", threshold=0.5, batch_size=32,
+                 use_onnx=False, nigerian_analyzer: Optional[NigerianContextAnalyzer] = None,
+                 compile_model=False, quantize_onnx=False):
+        # The base model is loaded lazily on first use (see the pipeline property)
+        self.model_name = model_name
+        self.use_onnx = use_onnx
+        self.compile_model = compile_model
+        # Dynamic int8 quantization of the ONNX export (only used together with use_onnx)
+        self.quantize_onnx = quantize_onnx
+        self._pipeline = None
         self.threshold = threshold
-        self.nigerian_analyzer = NigerianContextAnalyzer()
+        self.batch_size = batch_size
+        self.nigerian_analyzer = nigerian_analyzer or NigerianContextAnalyzer.get()
 
-    def detect(self, text: str) -> Dict:
+    @property
+    def pipeline(self):
+        """Lazy load the base text-classification pipeline"""
+        if self._pipeline is None:
+            # ONNX Runtime exports are cached separately from the PyTorch model
+            cache_key = f"{self.model_name}::onnx" if self.use_onnx else self.model_name
+            if self.use_onnx and self.quantize_onnx:
+                cache_key += "-int8"
+            if self.compile_model and not self.use_onnx:
+                cache_key += "::compiled"
+            if int8_enabled() and not self.use_onnx:
+                cache_key += "::int8"
+            self._pipeline = get_or_load_model(cache_key, self._load_model)["pipeline"]
+        return self._pipeline
+
+    def _load_model(self) -> Dict:
+        """Load tokenizer, model and pipeline for the base model"""
+        tokenizer = load_fast_tokenizer(self.model_name)
+        # Classification heads read the first token, so pad on the right for batched calls
+        tokenizer.padding_side = "right"
+        if self.use_onnx:
+            model = load_onnx_classifier(self.model_name, quantize=self.quantize_onnx)
+            pipe = pipeline("text-classification", model=model, tokenizer=tokenizer)
+        else:
+            # Inference only: eval mode, and half precision when a GPU is available
+            use_cuda = torch.cuda.is_available()
+            model = AutoModelForSequenceClassification.from_pretrained(
+                self.model_name, torch_dtype=torch.float16 if use_cuda else torch.float32
+            )
+            model.eval()
+            if int8_enabled() and not use_cuda:
+                model = quantize_dynamic_int8(model)
+            if self.compile_model:
+                model = torch.compile(model, mode="reduce-overhead")
+            pipe = pipeline("text-classification", model=model, tokenizer=tokenizer,
+                            device=0 if use_cuda else -1)
+        return {
+            "tokenizer": tokenizer,
+            "model": model,
+            "pipeline": pipe
+        }
+
+    def detect(self, text: str, nigerian_detections: Optional[List[BiasDetection]] = None) -> Dict:
         """Main detection method with comprehensive analysis"""
+        return self.detect_batch(
+            [text], nigerian_detections=None if nigerian_detections is None else [nigerian_detections]
+        )[0]
+
+    def detect_batch(self, texts: List[str], batch_size: Optional[int] = None,
+                     nigerian_detections: Optional[List[Optional[List[BiasDetection]]]] = None) -> List[Dict]:
+        """Detect bias for many texts with a single batched pipeline call"""
+        if not texts:
+            return []
+
+        # Feed texts shortest-first so each padded batch holds similar lengths,
+        # then put the predictions back in input order
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        
+        # The Nigerian sweep shares no state with the base model, so for real batches it runs on a
+        # shared worker thread while torch (which releases the GIL) works through the pipeline
+        nigerian_future = None
+        if nigerian_detections is None and len(texts) > 1:
+            nigerian_future = shared_executor("nigerian-sweep", 1).submit(self._analyze_nigerian_batch, texts)
+        
+        try:
+            # Base model detection for the whole batch, with autograd bookkeeping disabled
+            with torch.inference_mode():
+                sorted_results = self.pipeline(
+                    [texts[i] for i in order], batch_size=batch_size or self.batch_size, truncation=True
+                )
+        except Exception as e:
+            # Never leave the sweep running past this call: drop it if it has not started yet
+            if nigerian_future is not None and not nigerian_future.cancel():
+                wait([nigerian_future])
+            return [self._error_result(e) for _ in texts]
+        
+        if nigerian_future is not None:
+            nigerian_detections = nigerian_future.result()
+        
+        base_results = [None] * len(texts)
+        for i, base_result in zip(order, sorted_results):
+            base_results[i] = base_result
+
+        results = []
+        for i, (text, base_result) in enumerate(zip(texts, base_results)):
+            detections = nigerian_detections[i] if nigerian_detections is not None else None
+            results.append(self._build_result(text, base_result, detections))
+        return results
+
+    def _analyze_nigerian_batch(self, texts: List[str]) -> List[Optional[List[BiasDetection]]]:
+        """Nigerian context sweep per text; failures stay None so _build_result reports them"""
+        results = []
+        for text in texts:
+            try:
+                results.append(self.nigerian_analyzer.analyze_text(text))
+            except Exception:
+                results.append(None)
+        return results
+
+    def _build_result(self, text: str, base_result: Dict,
+                      nigerian_detections: Optional[List[BiasDetection]]) -> Dict:
+        """Combine a base model prediction with Nigerian context analysis"""
         try:
-            # Base model detection
-            base_result = self.pipeline(text)[0]
-            
             # Handle different model outputs
             if base_result['label'] in ['TOXIC', 'BIASED', '1']:
                 base_score = base_result['score']
             else:
                 base_score = 1 - base_result['score']
             
-            # Nigerian context analysis
-            nigerian_detections = self.nigerian_analyzer.analyze_text(text)
+            # Nigerian context analysis (reuse the caller's sweep when provided)
+            if nigerian_detections is None:
+                nigerian_detections = self.nigerian_analyzer.analyze_text(text)
             
             # Combine scores intelligently
             final_score, explanation = self._combine_scores(base_score, nigerian_detections)
@@ -443,35 +633,34 @@ class EnhancedBiasDetector:
             }
         
         except Exception as e:
-            return {
-                "is_biased": False,
-                "confidence": 0.0,
-                "error": f"Analysis failed: {str(e)}",
-                "nigerian_detections": [],
-                "explanation": "Technical error occurred during analysis"
-            }
+            return self._error_result(e)
+
+    def _error_result(self, error: Exception) -> Dict:
+        """Fallback report when analysis fails"""
+        return {
+            "is_biased": False,
+            "confidence": 0.0,
+            "error": f"Analysis failed: {str(error)}",
+            "nigerian_detections": [],
+            "explanation": "Technical error occurred during analysis"
+        }
 
     def _combine_scores(self, base_score: float, detections: List[BiasDetection]) -> Tuple[float, str]:
         """Intelligently combine base model score with Nigerian detections"""
         if not detections:
             return base_score, f"Base model analysis (confidence: {base_score:.3f})"
         
-        # Calculate enhancement from Nigerian context
-        nigerian_boost = 0.0
-        high_confidence_detections = []
-        
+        # Calculate enhancement from Nigerian context, counted in tenths so the
+        # loop can stop as soon as the cap is reached
+        boost_tenths = 0
         for detection in detections:
             if detection.confidence >= 0.7:
-                high_confidence_detections.append(detection)
-                if detection.bias_level == BiasLevel.HIGH:
-                    nigerian_boost += 0.3
-                elif detection.bias_level == BiasLevel.MEDIUM:
-                    nigerian_boost += 0.2
-                else:
-                    nigerian_boost += 0.1
+                boost_tenths += self._BOOST_TENTHS.get(detection.bias_level, 1)
+                if boost_tenths >= self._MAX_BOOST_TENTHS:
+                    break
         
         # Cap the boost
-        nigerian_boost = min(nigerian_boost, 0.4)
+        nigerian_boost = min(boost_tenths, self._MAX_BOOST_TENTHS) / 10
         
         # Combine scores with weighted average if both are significant
         if base_score >= 0.3 and nigerian_boost >= 0.1:
@@ -542,74 +731,179 @@ class EnhancedBiasDetector:
 class EnhancedBiasTypeClassifier:
     """Enhanced bias type classifier with Nigerian context"""
     
-    def __init__(self, model_name="facebook/bart-large-mnli"):
-        if model_name not in _model_cache:
-            _model_cache[model_name] = pipeline("zero-shot-classification", model=model_name)
-        self.classifier = _model_cache[model_name]
-        self.nigerian_analyzer = NigerianContextAnalyzer()
+    # Same hypothesis wording the zero-shot pipeline uses by default
+    LABEL_TEMPLATE = "This example is {}."
+    # Cosine similarities sit in a narrow band; scale them before the softmax
+    _EMBEDDING_LOGIT_SCALE = 20.0
+    
+    def __init__(self, model_name="facebook/bart-large-mnli", batch_size=8,
+                 nigerian_analyzer: Optional[NigerianContextAnalyzer] = None,
+                 embedding_model: Optional[str] = None):
+        # The zero-shot model is only needed as a fallback, so it is loaded on first use.
+        # Passing embedding_model (e.g. "sentence-transformers/all-MiniLM-L6-v2") swaps the
+        # fallback for a single forward pass scored by cosine similarity against the labels.
+        self.model_name = model_name
+        self.embedding_model = embedding_model
+        self._classifier = None
+        self._encoder = None
+        self.batch_size = batch_size
+        self.nigerian_analyzer = nigerian_analyzer or NigerianContextAnalyzer.get()
+        self.labels = [
+            "political bias", "ethnic bias", "religious bias", 
+            "gender bias", "social bias", "regional bias", "no bias"
+        ]
+
+    @property
+    def classifier(self):
+        """Lazy load the zero-shot classification pipeline"""
+        if self._classifier is None:
+            self._classifier = get_or_load_model(
+                self.model_name, lambda: pipeline("zero-shot-classification", model=self.model_name)
+            )
+        return self._classifier
+
+    @property
+    def encoder(self):
+        """Lazy load the sentence encoder and label embeddings for the embedding fallback"""
+        if self._encoder is None:
+            self._encoder = get_or_load_model(
+                (self.embedding_model, tuple(self.labels)), self._load_encoder
+            )
+        return self._encoder
+
+    def _load_encoder(self) -> Dict:
+        """Load the encoder and embed the labels once so they are shared across instances"""
+        model = AutoModel.from_pretrained(self.embedding_model)
+        model.eval()
+        encoder = {"tokenizer": load_fast_tokenizer(self.embedding_model), "model": model}
+        encoder["label_embeddings"] = self._embed(
+            encoder, [self.LABEL_TEMPLATE.format(label) for label in self.labels]
+        )
+        return encoder
+
+    @staticmethod
+    def _embed(encoder: Dict, texts: List[str]):
+        """Mean-pooled, L2-normalized sentence embeddings"""
+        inputs = encoder["tokenizer"](texts, padding=True, truncation=True, return_tensors="pt")
+        with torch.inference_mode():
+            token_embeddings = encoder["model"](**inputs).last_hidden_state
+        mask = inputs["attention_mask"].unsqueeze(-1).to(token_embeddings.dtype)
+        pooled = (token_embeddings * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        return F.normalize(pooled, p=2, dim=1)
 
-    def predict(self, text: str) -> Dict:
+    def _embedding_classify(self, texts: List[str], batch_size: int) -> List[Dict]:
+        """Rank labels by cosine similarity, shaped like zero-shot pipeline results"""
+        encoder = self.encoder
+        results = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            similarities = self._embed(encoder, chunk) @ encoder["label_embeddings"].T
+            probabilities = F.softmax(similarities * self._EMBEDDING_LOGIT_SCALE, dim=-1).tolist()
+            for text, scores in zip(chunk, probabilities):
+                order = sorted(range(len(self.labels)), key=lambda j: scores[j], reverse=True)
+                results.append({
+                    "sequence": text,
+                    "labels": [self.labels[j] for j in order],
+                    "scores": [scores[j] for j in order]
+                })
+        return results
+
+    def predict(self, text: str, nigerian_detections: Optional[List[BiasDetection]] = None) -> Dict:
         """Predict bias type with enhanced Nigerian context awareness"""
-        try:
-            # Analyze Nigerian context first
-            nigerian_detections = self.nigerian_analyzer.analyze_text(text)
-            
-            if nigerian_detections:
-                # Use Nigerian context for primary classification
-                primary_detection = nigerian_detections[0]  # Highest confidence
-                
-                response = {
-                    "type": self._format_bias_type(primary_detection),
-                    "confidence": round(primary_detection.confidence * 100, 2),
-                    "specific_target": primary_detection.term,
-                    "bias_category": primary_detection.category.value,
-                    "bias_direction": primary_detection.bias_direction,
-                    "explanation": primary_detection.explanation,
-                    "nigerian_context": True,
-                    "all_detections": [
-                        {
-                            "type": self._format_bias_type(d),
-                            "confidence": round(d.confidence * 100, 2),
-                            "term": d.term,
-                            "direction": d.bias_direction
-                        }
-                        for d in nigerian_detections[:3]  # Top 3
-                    ]
-                }
-            else:
-                # Fall back to general classification
-                labels = [
-                    "political bias", "ethnic bias", "religious bias", 
-                    "gender bias", "social bias", "regional bias", "no bias"
-                ]
-                
-                result = self.classifier(text, labels)
-                top_type = result['labels'][0]
-                top_confidence = round(result['scores'][0] * 100, 2)
-                
-                response = {
-                    "type": "neutral" if top_type == "no bias" and top_confidence > 70 else top_type,
-                    "confidence": top_confidence,
-                    "nigerian_context": False,
-                    "all_predictions": [
-                        {
-                            "type": label,
-                            "confidence": round(score * 100, 2)
-                        }
-                        for label, score in zip(result['labels'][:3], result['scores'][:3])
-                    ]
-                }
-            
-            return response
-        
-        except Exception as e:
-            return {
-                "type": "analysis_error",
-                "confidence": 0,
-                "error": str(e),
-                "nigerian_context": False,
-                "all_predictions": []
+        return self.predict_batch(
+            [text], nigerian_detections=None if nigerian_detections is None else [nigerian_detections]
+        )[0]
+
+    def predict_batch(self, texts: List[str], batch_size: Optional[int] = None,
+                      nigerian_detections: Optional[List[Optional[List[BiasDetection]]]] = None) -> List[Dict]:
+        """Predict bias types for many texts, batching the zero-shot fallback into one call"""
+        responses: List[Optional[Dict]] = [None] * len(texts)
+        fallback_indices = []
+
+        for i, text in enumerate(texts):
+            try:
+                # Analyze Nigerian context first (reuse the caller's sweep when provided)
+                detections = nigerian_detections[i] if nigerian_detections is not None else None
+                if detections is None:
+                    detections = self.nigerian_analyzer.analyze_text(text)
+
+                if detections:
+                    # Use Nigerian context for primary classification
+                    responses[i] = self._nigerian_response(detections)
+                else:
+                    fallback_indices.append(i)
+            except Exception as e:
+                responses[i] = self._error_response(e)
+
+        if fallback_indices:
+            # Fall back to general classification for the remaining texts in one batch
+            try:
+                fallback_texts = [texts[i] for i in fallback_indices]
+                if self.embedding_model:
+                    results = self._embedding_classify(fallback_texts, batch_size or self.batch_size)
+                else:
+                    results = self.classifier(
+                        fallback_texts, self.labels, batch_size=batch_size or self.batch_size
+                    )
+                for i, result in zip(fallback_indices, results):
+                    responses[i] = self._zero_shot_response(result)
+            except Exception as e:
+                for i in fallback_indices:
+                    responses[i] = self._error_response(e)
+
+        return responses
+
+    def _nigerian_response(self, nigerian_detections: List[BiasDetection]) -> Dict:
+        """Build the response from Nigerian context detections"""
+        all_detections = [
+            {
+                "type": self._format_bias_type(d),
+                "confidence": round(d.confidence * 100, 2),
+                "term": d.term,
+                "direction": d.bias_direction
             }
+            for d in nigerian_detections[:3]  # Top 3
+        ]
+        primary_detection = nigerian_detections[0]  # Highest confidence
+        
+        return {
+            "type": all_detections[0]["type"],
+            "confidence": all_detections[0]["confidence"],
+            "specific_target": primary_detection.term,
+            "bias_category": primary_detection.category.value,
+            "bias_direction": primary_detection.bias_direction,
+            "explanation": primary_detection.explanation,
+            "nigerian_context": True,
+            "all_detections": all_detections
+        }
+
+    def _zero_shot_response(self, result: Dict) -> Dict:
+        """Build the response from a zero-shot classification result"""
+        top_type = result['labels'][0]
+        top_confidence = round(result['scores'][0] * 100, 2)
+        
+        return {
+            "type": "neutral" if top_type == "no bias" and top_confidence > 70 else top_type,
+            "confidence": top_confidence,
+            "nigerian_context": False,
+            "all_predictions": [
+                {
+                    "type": label,
+                    "confidence": round(score * 100, 2)
+                }
+                for label, score in zip(result['labels'][:3], result['scores'][:3])
+            ]
+        }
+
+    def _error_response(self, error: Exception) -> Dict:
+        """Fallback response when analysis fails"""
+        return {
+            "type": "analysis_error",
+            "confidence": 0,
+            "error": str(error),
+            "nigerian_context": False,
+            "all_predictions": []
+        }
 
     def _format_bias_type(self, detection: BiasDetection) -> str:
         """Format bias type for display"""
@@ -628,7 +922,8 @@ class ClickbaitDetector:
     """Detect clickbait patterns in Nigerian context"""
     
     def __init__(self):
-        self.clickbait_patterns = [
+        # Patterns are compiled once here rather than looked up in re's cache on every detect()
+        self.clickbait_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in [
             # Universal patterns
             r'\b(shocking|unbelievable|you won\'t believe|must see|amazing|incredible)\b',
             r'\b(breaking|urgent|just in|developing|alert)\b',
@@ -642,35 +937,50 @@ class ClickbaitDetector:
             r'\b(see what|look what|check what)\s+(happened|occurs|occurs)\b',
             r'\b(nigerian|naija)\s+(secret|mystery|revelation)\b',
             r'\b(this nigerian|this naija)\s+(will|did|has)\b',
-        ]
+        ]]
+        
+        # All patterns fused into one zero-width alternation, so a single finditer pass reports
+        # which pattern matches at each position (the lookahead lets overlapping matches of
+        # different patterns, e.g. "must see" / "see what happened", both be found)
+        self._combined_clickbait = re.compile(
+            '(?=' + '|'.join(
+                f'(?P<p{i}>{pattern.pattern})' for i, pattern in enumerate(self.clickbait_patterns)
+            ) + ')',
+            re.IGNORECASE
+        )
         
-        self.clickbait_indicators = {
+        self.clickbait_indicators = {indicator: re.compile(pattern, re.IGNORECASE) for indicator, pattern in {
             "excessive_caps": r'[A-Z]{5,}',
             "excessive_punctuation": r'[!?]{2,}',
             "number_lists": r'\b\d+\s+(things|reasons|ways|secrets)\b',
             "superlatives": r'\b(best|worst|most|least|ultimate|perfect)\b',
             "urgency": r'\b(now|today|immediately|urgent|breaking|just in)\b'
-        }
+        }.items()}
 
-    def detect(self, text: str) -> Dict:
+    def detect(self, text: str, text_lower: Optional[str] = None) -> Dict:
         """Detect clickbait patterns"""
         clickbait_score = 0.0
-        detected_patterns = []
+        detected_patterns = set()
+        
+        if text_lower is None:
+            text_lower = text.lower()
         
-        text_lower = text.lower()
+        # Check main patterns in one pass; each pattern that matches scores once
+        pattern_matches: Dict[int, List[str]] = {}
+        for m in self._combined_clickbait.finditer(text_lower):
+            index = int(m.lastgroup[1:])
+            groups = self.clickbait_patterns[index].match(text_lower, m.start()).groups()
+            pattern_matches.setdefault(index, []).append(groups[0] if len(groups) == 1 else ' '.join(groups))
         
-        # Check main patterns
-        for pattern in self.clickbait_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                clickbait_score += 0.3
-                detected_patterns.extend([m if isinstance(m, str) else ' '.join(m) for m in matches])
+        for index in sorted(pattern_matches):
+            clickbait_score += 0.3
+            detected_patterns.update(pattern_matches[index])
         
         # Check additional indicators
         for indicator, pattern in self.clickbait_indicators.items():
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 clickbait_score += 0.2
-                detected_patterns.append(indicator.replace('_', ' '))
+                detected_patterns.add(indicator.replace('_', ' '))
         
         # Cap the score
         clickbait_score = min(clickbait_score, 1.0)
@@ -679,7 +989,7 @@ class ClickbaitDetector:
             "is_clickbait": clickbait_score >= 0.4,
             "confidence": clickbait_score,
             "level": "high" if clickbait_score >= 0.7 else "medium" if clickbait_score >= 0.4 else "low",
-            "detected_patterns": list(set(detected_patterns)),
+            "detected_patterns": list(detected_patterns),
             "explanation": f"Clickbait confidence: {clickbait_score:.2f} based on detected patterns"
         }
 
@@ -688,18 +998,111 @@ class ClickbaitDetector:
 class BiasLensAnalyzer:
     """Main analyzer combining all detection capabilities"""
     
-    def __init__(self):
+    # Texts shorter than this (ignoring surrounding whitespace) are not sent to the models
+    MIN_TEXT_LENGTH = 10
+
+    def __init__(self, cache_size: int = 1024, concurrent_models: bool = False):
+        # With concurrent_models=True the detector and classifier models overlap on multi-text batches
+        self.concurrent_models = concurrent_models
         self.bias_detector = EnhancedBiasDetector()
-        self.bias_classifier = EnhancedBiasTypeClassifier()
+        # Share one Nigerian context analyzer between the detector and the classifier
+        self.bias_classifier = EnhancedBiasTypeClassifier(nigerian_analyzer=self.bias_detector.nigerian_analyzer)
         self.clickbait_detector = ClickbaitDetector()
+        # Reports for recently analyzed texts, so retries skip the models; cache_size=0 disables it
+        self._report_cache = ResultCache(cache_size)
 
     def analyze(self, text: str) -> Dict:
         """Comprehensive analysis of text"""
-        bias_analysis = self.bias_detector.detect(text)
-        type_analysis = self.bias_classifier.predict(text)
-        clickbait_analysis = self.clickbait_detector.detect(text)
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """Comprehensive analysis of many texts, running each transformer model once per batch"""
+        reports: List[Optional[Dict]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            cached = self._report_cache.get(text)
+            if cached is not None:
+                reports[i] = cached
+            elif len(text.strip()) < self.MIN_TEXT_LENGTH:
+                reports[i] = self._insufficient_text_report(text)
+            else:
+                # Duplicates within the batch are analyzed once
+                pending.setdefault(text, []).append(i)
+
+        if not pending:
+            return reports
+
+        unique_texts = list(pending)
+        for text, report in zip(unique_texts, self._analyze_uncached(unique_texts)):
+            # Reports where the detector or the type classifier failed are not cached, so a retry reruns them
+            if report["technical_details"]["error"] is None and report["bias_details"]["type"] != "analysis_error":
+                self._report_cache.put(text, report)
+            indices = pending[text]
+            reports[indices[0]] = report
+            for i in indices[1:]:
+                reports[i] = copy.deepcopy(report)
+        return reports
+
+    def _analyze_uncached(self, texts: List[str]) -> List[Dict]:
+        """Run the rule-based passes and every model over texts"""
+        # Lowercase once for the rule-based passes
+        texts_lower = [text.lower() for text in texts]
         
-        # Combine into comprehensive report
+        # Run the Nigerian context sweep once per text and share it between detector and classifier
+        nigerian_detections = []
+        for text, text_lower in zip(texts, texts_lower):
+            try:
+                nigerian_detections.append(
+                    self.bias_detector.nigerian_analyzer.analyze_text(text, text_lower=text_lower)
+                )
+            except Exception:
+                nigerian_detections.append(None)  # Let each component handle the failure itself
+
+        clickbait_analyses = [
+            self.clickbait_detector.detect(text, text_lower=text_lower)
+            for text, text_lower in zip(texts, texts_lower)
+        ]
+
+        if self.concurrent_models and len(texts) > 1:
+            # The detector and classifier models are independent (torch releases the GIL), so they
+            # run side by side, each with half of the cores
+            limit_torch_threads(2)
+            executor = shared_executor("bias-models", 2)
+            bias_future = executor.submit(
+                self.bias_detector.detect_batch, texts, nigerian_detections=nigerian_detections
+            )
+            type_future = executor.submit(
+                self.bias_classifier.predict_batch, texts, nigerian_detections=nigerian_detections
+            )
+            bias_analyses = bias_future.result()
+            type_analyses = type_future.result()
+        else:
+            bias_analyses = self.bias_detector.detect_batch(texts, nigerian_detections=nigerian_detections)
+            type_analyses = self.bias_classifier.predict_batch(texts, nigerian_detections=nigerian_detections)
+        
+        return [
+            self._build_report(text, bias_analysis, type_analysis, clickbait_analysis)
+            for text, bias_analysis, type_analysis, clickbait_analysis
+            in zip(texts, bias_analyses, type_analyses, clickbait_analyses)
+        ]
+
+    def _insufficient_text_report(self, text: str) -> Dict:
+        """Report for texts too short to analyze; only the rule-based clickbait check runs"""
+        return self._build_report(
+            text,
+            {
+                "is_biased": False,
+                "confidence": 0.0,
+                "bias_level": "minimal",
+                "explanation": "Insufficient text for analysis"
+            },
+            {"type": "neutral", "confidence": 0, "nigerian_context": False},
+            self.clickbait_detector.detect(text)
+        )
+
+    def _build_report(self, text: str, bias_analysis: Dict, type_analysis: Dict,
+                      clickbait_analysis: Dict) -> Dict:
+        """Combine the component results for one text into the report"""
         return {
             "text": text[:200] + "..." if len(text) > 200 else text,
             "timestamp": "placeholder_timestamp",
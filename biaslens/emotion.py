@@ -1,18 +1,22 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+import copy
+from transformers import AutoModelForSequenceClassification
 import torch
 import torch.nn.functional as F
-from .utils import _model_cache
+from .utils import ResultCache, load_sequence_classifier
+
+# Results are shared by every EmotionClassifier, keyed on (model cache key, text, top_k)
+_result_cache = ResultCache()
 
 
 class EmotionClassifier:
-    def __init__(self, model_name="bhadresh-savani/distilbert-base-uncased-emotion"):
-        if model_name not in _model_cache:
-            _model_cache[model_name] = {
-                "tokenizer": AutoTokenizer.from_pretrained(model_name),
-                "model": AutoModelForSequenceClassification.from_pretrained(model_name),
-            }
-        self.tokenizer = _model_cache[model_name]["tokenizer"]
-        self.model = _model_cache[model_name]["model"]
+    def __init__(self, model_name="bhadresh-savani/distilbert-base-uncased-emotion", use_onnx=False, quantize_onnx=False,
+                 use_torchscript=False):
+        self.cache_key, cached = load_sequence_classifier(
+            AutoModelForSequenceClassification, model_name, use_onnx, quantize_onnx, use_torchscript
+        )
+        self.tokenizer = cached["tokenizer"]
+        self.model = cached["model"]
+        self.device = cached["device"]
         self.labels = ['sadness', 'joy', 'love', 'anger', 'fear', 'surprise']
 
         # Emotion intensity grouping for bias analysis
@@ -29,70 +33,118 @@ class EmotionClassifier:
         self.positive_emotions_for_risk = ['joy', 'love'] # Surprise is less about manipulation risk here
         self.negative_emotions_for_risk = ['sadness', 'anger', 'fear']
 
+        # O(1) lookups for the per-result helpers below, built once from the lists above
+        self._emotion_to_intensity = {
+            emotion: category
+            for category, emotions_list in reversed(list(self.emotion_intensity.items()))
+            for emotion in emotions_list
+        }
+        for emotion in self.negative_emotions_for_risk:
+            self._emotion_to_intensity.setdefault(emotion, 'high_intensity')
+        for emotion in self.positive_emotions_for_risk:
+            self._emotion_to_intensity.setdefault(emotion, 'positive_intensity')
+        self._negative_risk = frozenset(self.negative_emotions_for_risk)
+        self._positive_risk = frozenset(self.positive_emotions_for_risk)
+
 
     def classify(self, text, top_k=3):
+        return self.classify_batch([text], top_k=top_k)[0]
+
+    def classify_batch(self, texts, top_k=3):
+        """Classify emotions for many texts with a single padded forward pass"""
+        if not texts:
+            return []
+
+        results = [None] * len(texts)
+        pending = {}
+        for i, text in enumerate(texts):
+            cached = _result_cache.get((self.cache_key, text, top_k))
+            if cached is not None:
+                results[i] = cached
+            else:
+                # Duplicates within the batch share one row of the forward pass
+                pending.setdefault(text, []).append(i)
+
+        if not pending:
+            return results
+
         try:
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
+            inputs = self.tokenizer(list(pending), return_tensors="pt", truncation=True, max_length=512, padding=True)
 
-            with torch.no_grad():
+            if self.device != "cpu":
+                inputs = {name: tensor.to(self.device) for name, tensor in inputs.items()}
+
+            with torch.inference_mode(), torch.autocast("cuda", dtype=torch.float16, enabled=self.device == "cuda"):
                 outputs = self.model(**inputs)
-                scores = F.softmax(outputs.logits, dim=1)
-
-            # Get top prediction
-            predicted_class = torch.argmax(scores).item()
-            confidence = torch.max(scores).item()
-            primary_emotion = self.labels[predicted_class]
-
-            # Get top-k emotions for more detailed analysis
-            top_k_indices = torch.topk(scores, k=min(top_k, len(self.labels))).indices[0]
-            top_k_scores = torch.topk(scores, k=min(top_k, len(self.labels))).values[0]
-
-            top_emotions = []
-            for idx, score in zip(top_k_indices, top_k_scores):
-                top_emotions.append({
-                    "emotion": self.labels[idx.item()],
-                    "confidence": round(score.item() * 100, 2)
-                })
-
-            # Determine emotion intensity category
-            intensity_category = self._get_intensity_category(primary_emotion) # This will use the updated self.emotion_intensity
-
-            # Calculate emotional manipulation risk
-            manipulation_risk = self._calculate_manipulation_risk(primary_emotion, confidence) # This will use updated positive/negative lists
-
-            # Moderate intensity threshold for being charged (example, can be tuned)
-            moderate_intensity_threshold = 0.6 # Using confidence directly as a proxy for intensity strength
-
-            return {
-                "label": primary_emotion,
-                "confidence": round(confidence * 100, 2),
-                "intensity_category": intensity_category,
-                "manipulation_risk": manipulation_risk,
-                "top_emotions": top_emotions,
-                "is_emotionally_charged": confidence >= moderate_intensity_threshold # Updated logic
-            }
+            # Softmax in fp32 on the CPU, where the per-row results are read
+            scores = F.softmax(outputs.logits.float(), dim=1).cpu()
 
         except Exception as e:
-            return {
-                "label": "analysis_error",
-                "confidence": 0,
-                "intensity_category": "unknown",
-                "manipulation_risk": "unknown",
-                "top_emotions": [],
-                "is_emotionally_charged": False,
-                "error": str(e)
-            }
+            for indices in pending.values():
+                for i in indices:
+                    results[i] = self._error_result(e)
+            return results
+
+        for (text, indices), row_scores in zip(pending.items(), scores):
+            try:
+                result = self._build_result(row_scores, top_k)
+                _result_cache.put((self.cache_key, text, top_k), result)
+            except Exception as e:
+                result = self._error_result(e)
+            results[indices[0]] = result
+            for i in indices[1:]:
+                results[i] = copy.deepcopy(result)
+        return results
+
+    def _build_result(self, scores, top_k):
+        """Build the emotion report from one text's softmax scores"""
+        # One top-k selection gives both the primary emotion and the detailed ranking
+        num_ranked = min(top_k, len(self.labels))
+        top = torch.topk(scores, k=max(num_ranked, 1))
+        top_indices = top.indices.tolist()
+        top_scores = top.values.tolist()
+        primary_emotion = self.labels[top_indices[0]]
+        confidence = top_scores[0]
+
+        top_emotions = [
+            {"emotion": self.labels[idx], "confidence": round(score * 100, 2)}
+            for idx, score in zip(top_indices[:num_ranked], top_scores[:num_ranked])
+        ]
+
+        # Determine emotion intensity category
+        intensity_category = self._get_intensity_category(primary_emotion) # This will use the updated self.emotion_intensity
+
+        # Calculate emotional manipulation risk
+        manipulation_risk = self._calculate_manipulation_risk(primary_emotion, confidence) # This will use updated positive/negative lists
+
+        # Moderate intensity threshold for being charged (example, can be tuned)
+        moderate_intensity_threshold = 0.6 # Using confidence directly as a proxy for intensity strength
+
+        return {
+            "label": primary_emotion,
+            "confidence": round(confidence * 100, 2),
+            "intensity_category": intensity_category,
+            "manipulation_risk": manipulation_risk,
+            "top_emotions": top_emotions,
+            "is_emotionally_charged": confidence >= moderate_intensity_threshold # Updated logic
+        }
+
+    def _error_result(self, error):
+        """Fallback result when classification fails"""
+        return {
+            "label": "analysis_error",
+            "confidence": 0,
+            "intensity_category": "unknown",
+            "manipulation_risk": "unknown",
+            "top_emotions": [],
+            "is_emotionally_charged": False,
+            "error": str(error)
+        }
 
     def _get_intensity_category(self, emotion):
         """Categorize emotion by intensity level"""
-        # Adjusted to use the new 6-label system
-        for category, emotions_list in self.emotion_intensity.items():
-            if emotion in emotions_list:
-                return category
-        # Fallback if an emotion (somehow) isn't in the new intensity map
-        if emotion in self.negative_emotions_for_risk: return 'high_intensity' # Default for known negative
-        if emotion in self.positive_emotions_for_risk: return 'positive_intensity' # Default for known positive
-        return "unknown"
+        # Adjusted to use the new 6-label system; unmapped emotions fall back to "unknown"
+        return self._emotion_to_intensity.get(emotion, "unknown")
 
     def _calculate_manipulation_risk(self, emotion, confidence):
         """Calculate risk of emotional manipulation based on emotion type and confidence,
@@ -102,16 +154,18 @@ class EmotionClassifier:
         # Joy/Love (positive_emotions_for_risk) could also be manipulative if confidence is very high,
         # but typically less so than fear/anger. Surprise is neutral in this context.
 
-        if emotion in self.negative_emotions_for_risk and confidence > 0.7: # e.g. fear, anger
-            return "high"
-        elif emotion in self.negative_emotions_for_risk and confidence > 0.5: # e.g. sadness
-            return "medium"
-        # Consider very high confidence positive emotions as potentially manipulative (e.g. excessive hype)
-        elif emotion in self.positive_emotions_for_risk and confidence > 0.85:
-            return "medium"
-        elif emotion in self.negative_emotions_for_risk and confidence > 0.3: # Lower confidence negative
-            return "low"
-        elif emotion in self.positive_emotions_for_risk and confidence > 0.6: # Moderate positive
-            return "low"
-        else: # Includes 'surprise' and low confidence positive/negative emotions
-            return "minimal"
\ No newline at end of file
+        if emotion in self._negative_risk:
+            if confidence > 0.7: # e.g. fear, anger
+                return "high"
+            if confidence > 0.5: # e.g. sadness
+                return "medium"
+            if confidence > 0.3: # Lower confidence negative
+                return "low"
+        elif emotion in self._positive_risk:
+            # Consider very high confidence positive emotions as potentially manipulative (e.g. excessive hype)
+            if confidence > 0.85:
+                return "medium"
+            if confidence > 0.6: # Moderate positive
+                return "low"
+        # Includes 'surprise' and low confidence positive/negative emotions
+        return "minimal"
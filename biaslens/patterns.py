@@ -1,5 +1,9 @@
+import hashlib
 import re
-from typing import Dict, Tuple
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 
 
 class NigerianPatterns:
@@ -41,16 +45,19 @@ class NigerianPatterns:
     @staticmethod
     def analyze_patterns(text: str) -> Dict:
         """Comprehensive pattern analysis for Nigerian context"""
+        # Trigger phrases and clickbait come from the shared single-pass scan
+        return NigerianPatterns._from_scan(PatternEngine.scan(text))
 
-        # Use compiled regex for trigger phrases
-        trigger_matches = NigerianPatterns._COMPILED_NIGERIAN_TRIGGERS.findall(text)
-
-        # Use compiled regex for clickbait patterns
-        clickbait_matches = NigerianPatterns._COMPILED_CLICKBAIT_PATTERNS.findall(text)
+    @staticmethod
+    def _from_scan(scan: Dict) -> Dict:
+        """Build the Nigerian pattern analysis from a PatternEngine scan"""
+        trigger_matches = list(scan["triggers"])
+        clickbait_matches = list(scan["clickbait"])
 
         # Calculate scores
-        trigger_score = len(trigger_matches) / max(len(text.split()), 1) * 100
-        clickbait_score = len(clickbait_matches) / max(len(text.split()), 1) * 100
+        word_count = max(scan["word_count"], 1)
+        trigger_score = len(trigger_matches) / word_count * 100
+        clickbait_score = len(clickbait_matches) / word_count * 100
 
         return {
             "has_triggers": len(trigger_matches) > 0,
@@ -96,6 +103,8 @@ class FakeNewsDetector:
         r"scientists confirm", r"doctors warn"  # without specific names
     ]
 
+    _RISK_LEVELS = ("minimal", "low", "medium", "high")
+
     _COMPILED_FAKE_PATTERNS = re.compile(
         r'|'.join(f"(?:{p})" for p in FAKE_PATTERNS),
         re.IGNORECASE
@@ -108,28 +117,23 @@ class FakeNewsDetector:
     @staticmethod
     def detect(text: str) -> Tuple[bool, Dict]:
         """Enhanced fake news detection with scoring"""
-        # Use compiled regex for fake news patterns
-        # This can return List[Union[str, Tuple[str,...]]]
-        raw_fake_matches_output = FakeNewsDetector._COMPILED_FAKE_PATTERNS.findall(text)
+        # Fake news patterns and credibility red flags come from the shared single-pass scan
+        return FakeNewsDetector._from_scan(PatternEngine.scan(text))
 
+    @staticmethod
+    def _from_scan(scan: Dict) -> Tuple[bool, Dict]:
+        """Build the fake news verdict and details from a PatternEngine scan"""
+        # The fake news regex has capture groups, so its matches are group tuples;
+        # keep the first non-empty group of each, dropping matches without one
         processed_fake_matches = []
-        if raw_fake_matches_output:
-            for match_item in raw_fake_matches_output:
-                actual_match_text = ""
-                if isinstance(match_item, tuple):
-                    # Find the first non-empty string in the tuple
-                    actual_match_text = next((s for s in match_item if s), "")
-                elif isinstance(match_item, str):
-                    actual_match_text = match_item
-
-                if actual_match_text:
-                    processed_fake_matches.append(actual_match_text)
-
-        # Use compiled regex for credibility red flags (this one correctly returns List[str])
-        credibility_flags = FakeNewsDetector._COMPILED_CREDIBILITY_FLAGS.findall(text)
+        for match_item in scan["fake"]:
+            actual_match_text = next((s for s in match_item if s), "")
+            if actual_match_text:
+                processed_fake_matches.append(actual_match_text)
+        credibility_flags = list(scan["credibility"])
 
         # Calculate risk score
-        total_words = len(text.split())
+        total_words = scan["word_count"]
         # Use length of processed_fake_matches for calculations
         fake_score = (len(processed_fake_matches) / max(total_words, 1)) * 100 if total_words > 0 else 0
         credibility_score = (len(credibility_flags) / max(total_words, 1)) * 100 if total_words > 0 else 0
@@ -137,20 +141,11 @@ class FakeNewsDetector:
         # Determine overall risk using processed_fake_matches
         is_suspicious = len(processed_fake_matches) > 0 or len(credibility_flags) > 1
 
-        # Risk level calculation also depends on the updated fake_score
-        if fake_score > 5 or credibility_score > 3: # threshold for high risk based on density
-            risk_level = "high"
-        elif fake_score > 2 or credibility_score > 1: # threshold for medium risk
-            risk_level = "medium"
-        elif len(processed_fake_matches) > 0 or len(credibility_flags) > 0: # any match means at least low risk
-            risk_level = "low"
-        else:
-            risk_level = "minimal"
-
-        # If is_suspicious is True but risk_level is minimal (e.g. 1 credibility_flag and 0 fake_matches), adjust to low.
-        if is_suspicious and risk_level == "minimal":
-            risk_level = "low"
-
+        # Risk level from density tiers: medium above 2% fake / 1% credibility flags, high above
+        # 5% / 3%; below both, any match at all still means low risk
+        density_tier = max((fake_score > 2) + (fake_score > 5), (credibility_score > 1) + (credibility_score > 3))
+        total_flags = len(processed_fake_matches) + len(credibility_flags)
+        risk_level = FakeNewsDetector._RISK_LEVELS[density_tier + 1 if density_tier else int(total_flags > 0)]
 
         return is_suspicious, {
             "fake_matches": processed_fake_matches, # Use the processed list of strings
@@ -158,7 +153,7 @@ class FakeNewsDetector:
             "fake_score": round(fake_score, 2),
             "credibility_score": round(credibility_score, 2),
             "risk_level": risk_level,
-            "total_flags": len(processed_fake_matches) + len(credibility_flags) # Use length of processed list
+            "total_flags": total_flags
         }
 
 
@@ -187,14 +182,152 @@ class ViralityDetector:
     @staticmethod
     def analyze_virality(text: str) -> Dict:
         """Analyze viral manipulation patterns"""
-        # Use compiled regex for viral patterns
-        viral_matches = ViralityDetector._COMPILED_VIRAL_PATTERNS.findall(text)
+        # Viral patterns come from the shared single-pass scan
+        return ViralityDetector._from_scan(PatternEngine.scan(text))
+
+    @staticmethod
+    def _from_scan(scan: Dict) -> Dict:
+        """Build the virality analysis from a PatternEngine scan"""
+        viral_matches = list(scan["viral"])
 
-        viral_score = (len(viral_matches) / max(len(text.split()), 1)) * 100
+        viral_score = (len(viral_matches) / max(scan["word_count"], 1)) * 100
 
         return {
             "has_viral_patterns": len(viral_matches) > 0,
             "viral_matches": viral_matches,
             "viral_score": round(viral_score, 2),
             "manipulation_level": "high" if viral_score > 3 else "medium" if viral_score > 1 else "low"
-        }
\ No newline at end of file
+        }
+
+
+def _required_literal(pattern: str):
+    """Longest lowercase literal that every match of pattern contains, or None if there is none"""
+    runs, current = [], []
+    depth, i = 0, 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            # Escapes (\b, \d, \w, ...) end the current literal run
+            runs.append(current)
+            current = []
+            i += 2
+            continue
+        if char == "[":
+            runs.append(current)
+            current = []
+            i = pattern.index("]", i + 2)
+        elif char in "?*{":
+            # The preceding character is optional
+            if current:
+                current.pop()
+            runs.append(current)
+            current = []
+            if char == "{":
+                i = pattern.index("}", i)
+        elif char == "|" and depth == 0:
+            return None
+        elif char in "()+.^$|":
+            depth += (char == "(") - (char == ")")
+            runs.append(current)
+            current = []
+        elif depth == 0:
+            current.append(char)
+        i += 1
+    runs.append(current)
+    literal = max(("".join(run) for run in runs), key=len)
+    return literal.lower() or None
+
+
+class PatternEngine:
+    """Scans a text once for every pattern family used by the detectors above"""
+
+    FAMILIES = (
+        ("triggers", NigerianPatterns._COMPILED_NIGERIAN_TRIGGERS, NigerianPatterns.NIGERIAN_TRIGGER_PHRASES),
+        ("clickbait", NigerianPatterns._COMPILED_CLICKBAIT_PATTERNS, NigerianPatterns.CLICKBAIT_PATTERNS),
+        ("fake", FakeNewsDetector._COMPILED_FAKE_PATTERNS, FakeNewsDetector.FAKE_PATTERNS),
+        ("credibility", FakeNewsDetector._COMPILED_CREDIBILITY_FLAGS, FakeNewsDetector.CREDIBILITY_RED_FLAGS),
+        ("viral", ViralityDetector._COMPILED_VIRAL_PATTERNS, ViralityDetector.VIRAL_PATTERNS),
+    )
+
+    # Per family: the str regex, the same regex compiled for bytes, and a literal that each
+    # pattern's matches must contain (None when some pattern has no such literal). A family none
+    # of whose literals occur in the text cannot match, so its regex is skipped; substring search
+    # is far cheaper than the alternation.
+    _SCANNERS = tuple(
+        (
+            name,
+            compiled,
+            re.compile(compiled.pattern.encode("ascii"), compiled.flags & ~re.UNICODE),
+            None if None in literals else tuple(dict.fromkeys(literals)),
+        )
+        for name, compiled, literals in (
+            (name, compiled, [_required_literal(p) for p in patterns])
+            for name, compiled, patterns in FAMILIES
+        )
+    )
+
+    # Recent scans keyed by a 128-bit digest of the text, so long articles are not kept alive as keys
+    CACHE_SIZE = 4096
+    _cache: "OrderedDict[bytes, MappingProxyType]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def scan(text: str) -> MappingProxyType:
+        """findall results per family plus the word count; repeated calls for the same text share one scan"""
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with PatternEngine._cache_lock:
+            cached = PatternEngine._cache.get(key)
+            if cached is not None:
+                PatternEngine._cache.move_to_end(key)
+                return cached
+
+        # Read-only, since every caller shares the cached result
+        result = MappingProxyType(PatternEngine._scan_uncached(text))
+        with PatternEngine._cache_lock:
+            PatternEngine._cache[key] = result
+            if len(PatternEngine._cache) > PatternEngine.CACHE_SIZE:
+                PatternEngine._cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop every cached scan"""
+        with PatternEngine._cache_lock:
+            PatternEngine._cache.clear()
+
+    @staticmethod
+    def _ascii_findall(compiled_ascii, subject: bytes) -> Tuple:
+        """findall over ASCII bytes, with every match (or group tuple) decoded back to str"""
+        return tuple(
+            tuple(group.decode("ascii") for group in item) if isinstance(item, tuple) else item.decode("ascii")
+            for item in compiled_ascii.findall(subject)
+        )
+
+    @staticmethod
+    def _scan_uncached(text: str) -> Dict:
+        """Run every pattern family over text"""
+        # For ASCII text the bytes regexes give identical matches (IGNORECASE, \b and \w only differ
+        # outside ASCII) without sre's Unicode lookups, and lowercasing mirrors IGNORECASE exactly.
+        # Any other text runs every str regex.
+        is_ascii = text.isascii()
+        if is_ascii:
+            subject = text.encode("ascii")
+            lowered = text.lower()
+
+        matches = {}
+        for name, compiled, compiled_ascii, literals in PatternEngine._SCANNERS:
+            if not is_ascii:
+                matches[name] = tuple(compiled.findall(text))
+            elif literals is not None and not any(lit in lowered for lit in literals):
+                matches[name] = ()
+            else:
+                matches[name] = PatternEngine._ascii_findall(compiled_ascii, subject)
+
+        matches["word_count"] = len(text.split())
+        return matches
+
+
+def analyze_all(text: str) -> Tuple[Dict, Tuple[bool, Dict], Dict]:
+    """Nigerian pattern, fake news and virality analyses of text, built from one shared scan"""
+    scan = PatternEngine.scan(text)
+    return NigerianPatterns._from_scan(scan), FakeNewsDetector._from_scan(scan), ViralityDetector._from_scan(scan)
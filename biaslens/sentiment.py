@@ -1,118 +1,173 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+import copy
+import re
+from transformers import AutoModelForSequenceClassification
 import torch
 import torch.nn.functional as F
-from .utils import _model_cache
+from .utils import ResultCache, load_fast_tokenizer, load_sequence_classifier
 
+# Text normalisation patterns used by _preprocess_text
+_WHITESPACE_RE = re.compile(r'\s+')
+_MENTION_RE = re.compile(r'@\w+')
+_URL_RE = re.compile(r'http\S+|www\S+')
+_REPEATED_BANG_RE = re.compile(r'[!]{2,}')
+_REPEATED_QUESTION_RE = re.compile(r'[?]{2,}')
+_ELLIPSIS_RE = re.compile(r'[.]{3,}')
 
-class SentimentAnalyzer:
-    def __init__(self, model_name="cardiffnlp/twitter-roberta-base-sentiment-latest"):
-        if model_name not in _model_cache:
-            try:
-                # Try without from_tf first (newer models don't need it)
-                tokenizer = AutoTokenizer.from_pretrained(model_name)
-            except:
-                # Fallback to from_tf if needed
-                tokenizer = AutoTokenizer.from_pretrained(model_name, from_tf=True)
-
-            model = AutoModelForSequenceClassification.from_pretrained(model_name)
-            _model_cache[model_name] = {
-                "tokenizer": tokenizer,
-                "model": model,
-            }
 
-        self.tokenizer = _model_cache[model_name]["tokenizer"]
-        self.model = _model_cache[model_name]["model"]
+def _load_tokenizer(model_name):
+    """Load the sentiment tokenizer, retrying with from_tf=True when the plain load fails"""
+    try:
+        # Try without from_tf first (newer models don't need it)
+        return load_fast_tokenizer(model_name)
+    except:
+        # Fallback to from_tf if needed
+        return load_fast_tokenizer(model_name, from_tf=True)
+
+
+# Results are shared by every SentimentAnalyzer, keyed on (model cache key, text)
+_result_cache = ResultCache()
+
+
+class SentimentAnalyzer:
+    def __init__(self, model_name="cardiffnlp/twitter-roberta-base-sentiment-latest", use_onnx=False, quantize_onnx=False,
+                 use_torchscript=False):
+        self.cache_key, cached = load_sequence_classifier(
+            AutoModelForSequenceClassification, model_name, use_onnx, quantize_onnx, use_torchscript,
+            tokenizer_loader=_load_tokenizer
+        )
+        self.tokenizer = cached["tokenizer"]
+        self.model = cached["model"]
+        self.device = cached["device"]
         self.labels = ['negative', 'neutral', 'positive']
 
     def analyze(self, text):
-        try:
-            # Handle empty or very short text
-            if not text or len(text.strip()) < 3:
-                return {
-                    'label': 'neutral',
-                    'confidence': 0.5,
-                    'all_scores': {'negative': 0.33, 'neutral': 0.5, 'positive': 0.17},
-                    'sentiment_strength': 'weak',
-                    'bias_indicator': False
-                }
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(self, texts):
+        """Analyze sentiment for many texts with a single padded forward pass"""
+        results = [None] * len(texts)
+        pending = {}
+
+        for i, text in enumerate(texts):
+            try:
+                # Handle empty or very short text
+                if not text or len(text.strip()) < 3:
+                    results[i] = {
+                        'label': 'neutral',
+                        'confidence': 0.5,
+                        'all_scores': {'negative': 0.33, 'neutral': 0.5, 'positive': 0.17},
+                        'sentiment_strength': 'weak',
+                        'bias_indicator': False
+                    }
+                else:
+                    cached = _result_cache.get((self.cache_key, text))
+                    if cached is not None:
+                        results[i] = cached
+                    else:
+                        # Duplicates within the batch share one row of the forward pass
+                        pending.setdefault(text, []).append(i)
+            except Exception as e:
+                results[i] = self._error_result(e)
+
+        if not pending:
+            return results
 
+        try:
             # Preprocess text (remove excessive whitespace, handle mentions/hashtags)
-            cleaned_text = self._preprocess_text(text)
+            cleaned_texts = [self._preprocess_text(text) for text in pending]
 
             # Tokenize with proper truncation
             encoded_input = self.tokenizer(
-                cleaned_text,
+                cleaned_texts,
                 return_tensors='pt',
                 truncation=True,
                 max_length=512,
                 padding=True
             )
 
-            with torch.no_grad():
-                output = self.model(**encoded_input)
-
-            # Convert to probabilities
-            scores = output.logits[0]
-            probs = F.softmax(scores, dim=0)
+            if self.device != "cpu":
+                encoded_input = {name: tensor.to(self.device) for name, tensor in encoded_input.items()}
 
-            # Get predictions
-            top_class = torch.argmax(probs).item()
-            confidence = probs[top_class].item()
-
-            # Create score dictionary
-            all_scores = {}
-            for i, label in enumerate(self.labels):
-                all_scores[label] = round(probs[i].item(), 3)
-
-            # Determine sentiment strength
-            sentiment_strength = self._calculate_sentiment_strength(confidence, all_scores)
-
-            # Check for bias indicators (extreme sentiment with high confidence)
-            bias_indicator = self._check_bias_indicator(self.labels[top_class], confidence, all_scores)
-
-            # Calculate polarization score (how far from neutral)
-            polarization = abs(all_scores['positive'] - all_scores['negative'])
+            with torch.inference_mode(), torch.autocast("cuda", dtype=torch.float16, enabled=self.device == "cuda"):
+                output = self.model(**encoded_input)
 
-            return {
-                'label': self.labels[top_class],
-                'confidence': round(confidence, 3),
-                'all_scores': all_scores,
-                'sentiment_strength': sentiment_strength,
-                'bias_indicator': bias_indicator,
-                'polarization_score': round(polarization, 3),
-                'is_polarized': polarization > 0.6,  # Highly polarized content
-                'emotional_tone': self._get_emotional_tone(all_scores)
-            }
+            # Convert to probabilities (fp32, on the CPU where the per-row results are read)
+            probs_batch = F.softmax(output.logits.float(), dim=-1).cpu()
 
         except Exception as e:
-            # Fallback response if analysis fails
-            return {
-                'label': 'neutral',
-                'confidence': 0.0,
-                'all_scores': {'negative': 0.33, 'neutral': 0.34, 'positive': 0.33},
-                'sentiment_strength': 'unknown',
-                'bias_indicator': False,
-                'polarization_score': 0.0,
-                'is_polarized': False,
-                'emotional_tone': 'neutral',
-                'error': str(e)
-            }
+            for indices in pending.values():
+                for i in indices:
+                    results[i] = self._error_result(e)
+            return results
+
+        for (text, indices), probs in zip(pending.items(), probs_batch):
+            try:
+                result = self._build_result(probs)
+                _result_cache.put((self.cache_key, text), result)
+            except Exception as e:
+                result = self._error_result(e)
+            results[indices[0]] = result
+            for i in indices[1:]:
+                results[i] = copy.deepcopy(result)
+        return results
+
+    def _build_result(self, probs):
+        """Build the sentiment report from one text's probabilities"""
+        # Get predictions from a single tensor-to-list conversion
+        values = probs.tolist()
+        top_class = max(range(len(values)), key=values.__getitem__)
+        confidence = values[top_class]
+
+        # Create score dictionary
+        all_scores = {label: round(value, 3) for label, value in zip(self.labels, values)}
+
+        # Determine sentiment strength
+        sentiment_strength = self._calculate_sentiment_strength(confidence, all_scores)
+
+        # Check for bias indicators (extreme sentiment with high confidence)
+        bias_indicator = self._check_bias_indicator(self.labels[top_class], confidence, all_scores)
+
+        # Calculate polarization score (how far from neutral)
+        polarization = abs(all_scores['positive'] - all_scores['negative'])
+
+        return {
+            'label': self.labels[top_class],
+            'confidence': round(confidence, 3),
+            'all_scores': all_scores,
+            'sentiment_strength': sentiment_strength,
+            'bias_indicator': bias_indicator,
+            'polarization_score': round(polarization, 3),
+            'is_polarized': polarization > 0.6,  # Highly polarized content
+            'emotional_tone': self._get_emotional_tone(all_scores)
+        }
+
+    def _error_result(self, error):
+        """Fallback response if analysis fails"""
+        return {
+            'label': 'neutral',
+            'confidence': 0.0,
+            'all_scores': {'negative': 0.33, 'neutral': 0.34, 'positive': 0.33},
+            'sentiment_strength': 'unknown',
+            'bias_indicator': False,
+            'polarization_score': 0.0,
+            'is_polarized': False,
+            'emotional_tone': 'neutral',
+            'error': str(error)
+        }
 
     def _preprocess_text(self, text):
         """Clean and preprocess text for better sentiment analysis"""
-        import re
-
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE_RE.sub(' ', text.strip())
 
         # Handle Twitter-specific elements (keep context but normalize)
-        text = re.sub(r'@\w+', '@USER', text)  # Replace mentions
-        text = re.sub(r'http\S+|www\S+', 'URL', text)  # Replace URLs
+        text = _MENTION_RE.sub('@USER', text)  # Replace mentions
+        text = _URL_RE.sub('URL', text)  # Replace URLs
 
         # Handle excessive punctuation
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
-        text = re.sub(r'[.]{3,}', '...', text)
+        text = _REPEATED_BANG_RE.sub('!', text)
+        text = _REPEATED_QUESTION_RE.sub('?', text)
+        text = _ELLIPSIS_RE.sub('...', text)
 
         return text
 
@@ -159,17 +214,14 @@ class SentimentAnalyzer:
     def analyze_headline_vs_content(self, headline, content):
         """Compare sentiment between headline and content to detect clickbait"""
         try:
-            headline_sentiment = self.analyze(headline)
-            content_sentiment = self.analyze(content)
+            # Both texts share one forward pass (and the result cache, for reused article bodies)
+            headline_sentiment, content_sentiment = self.analyze_batch([headline, content])
 
-            # Calculate sentiment mismatch
+            # Calculate sentiment mismatch (mean absolute difference of the per-label scores)
             headline_score = headline_sentiment['all_scores']
             content_score = content_sentiment['all_scores']
 
-            mismatch_score = 0
-            for label in self.labels:
-                mismatch_score += abs(headline_score[label] - content_score[label])
-
+            mismatch_score = sum(abs(headline_score[label] - content_score[label]) for label in self.labels)
             mismatch_score = round(mismatch_score / len(self.labels), 3)
 
             return {
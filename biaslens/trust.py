@@ -1,11 +1,99 @@
+import copy
 import random
 import math
-from typing import Dict, List, Tuple, Optional
-from .patterns import NigerianPatterns, FakeNewsDetector, ViralityDetector
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Tuple, Optional
+from .patterns import analyze_all
+
+
+class RiskFactor:
+    """Bit flags for the risk factors a trust calculation can raise, in detection order"""
+    HIGH_BIAS = 1 << 0
+    STRONG_BIAS = 1 << 1
+    MODERATE_BIAS = 1 << 2
+    MILD_BIAS = 1 << 3
+    NIGERIAN_BIAS = 1 << 4
+    EMOTIONAL_MANIPULATION = 1 << 5
+    MODERATE_EMOTIONAL_MANIPULATION = 1 << 6
+    EMOTIONAL_CONTENT = 1 << 7
+    EXTREME_EMOTION = 1 << 8
+    STRONG_EMOTION = 1 << 9
+    MILD_EMOTION = 1 << 10
+    SENTIMENT_BIAS = 1 << 11
+    POLARIZED_CONTENT = 1 << 12
+    DIVISIVE_SENTIMENT = 1 << 13
+    NEGATIVE_SENTIMENT = 1 << 14
+    HIGH_FAKE_RISK = 1 << 15
+    MEDIUM_FAKE_RISK = 1 << 16
+    LOW_FAKE_RISK = 1 << 17
+    NIGERIAN_TRIGGERS = 1 << 18
+    CLICKBAIT = 1 << 19
+    VIRAL_MANIPULATION = 1 << 20
+    MILD_VIRAL_MANIPULATION = 1 << 21
+    LOW_VIRAL_MANIPULATION = 1 << 22
+
+    # Public risk factor names, indexed by bit position
+    NAMES = (
+        "high_bias", "strong_bias", "moderate_bias", "mild_bias", "nigerian_bias",
+        "emotional_manipulation", "moderate_emotional_manipulation", "emotional_content",
+        "extreme_emotion", "strong_emotion", "mild_emotion",
+        "sentiment_bias", "polarized_content", "divisive_sentiment", "negative_sentiment",
+        "high_fake_risk", "medium_fake_risk", "low_fake_risk",
+        "nigerian_triggers", "clickbait",
+        "viral_manipulation", "mild_viral_manipulation", "low_viral_manipulation",
+    )
+
+    @classmethod
+    def names(cls, mask: int) -> List[str]:
+        """Names of the risk factors set in mask, in detection order"""
+        return [name for bit, name in enumerate(cls.NAMES) if mask >> bit & 1]
+
+    @staticmethod
+    def count(mask: int) -> int:
+        """Number of risk factors set in mask"""
+        return bin(mask).count('1')
+
+
+class PatternAnalysis(NamedTuple):
+    """Pattern analyses behind a trust score; the fake news and viral entries are None when nothing was found"""
+    nigerian_patterns: Dict
+    fake_news_risk: Optional[Dict]
+    viral_manipulation: Optional[Dict]
+
+
+class TrustResult(dict):
+    """Details returned alongside the trust score by TrustScoreCalculator.calculate
+
+    A plain dict (JSON-serializable, with the usual key access) whose keys can also be read as attributes.
+    """
+    __slots__ = ()
+
+    trust_level = property(itemgetter('trust_level'))
+    risk_factors = property(itemgetter('risk_factors'))
+    summary = property(itemgetter('summary'))
+    deductions = property(itemgetter('deductions'))
+    total_deduction = property(itemgetter('total_deduction'))
+    adjusted_deduction = property(itemgetter('adjusted_deduction'))
+    pattern_analysis = property(itemgetter('pattern_analysis'))
+
+    def __init__(self, trust_level: str, risk_factors: List[str], summary: str, deductions: List[float],
+                 total_deduction: float, adjusted_deduction: float, pattern_analysis: PatternAnalysis):
+        super().__init__(
+            trust_level=trust_level,
+            risk_factors=risk_factors,
+            summary=summary,
+            deductions=deductions,
+            total_deduction=total_deduction,
+            adjusted_deduction=adjusted_deduction,
+            pattern_analysis=pattern_analysis
+        )
 
 
 class TrustScoreCalculator:
-    DID_YOU_KNOW_TIPS = [
+    DID_YOU_KNOW_TIPS = (
         "Verify information before sharing. Check multiple reputable sources to confirm a story's accuracy.",
         "Be wary of headlines designed to provoke strong emotions. They might prioritize clicks over facts.",
         "Look for bylines and author credentials. Anonymous sources can be a red flag for misinformation.",
@@ -26,9 +114,18 @@ class TrustScoreCalculator:
         "Recognize that headlines don't always tell the full story. Read the article thoroughly.",
         "Be cautious with user-generated content (comments, social media posts) as it's often unverified.",
         "Understand the difference between correlation and causation when interpreting data or events."
-    ]
+    )
+
+    # Texts shorter than this (after stripping) get a neutral score without any analysis
+    MIN_TEXT_LENGTH = 10
+    INSUFFICIENT_TEXT_SCORE = 50.0
+    # Pattern analysis of an empty text, copied into the results for texts that skip the scan
+    _EMPTY_PATTERN_ANALYSIS = PatternAnalysis(analyze_all("")[0], None, None)
 
-    # Improved thresholds with more granular levels
+    # Tips are drawn from a dedicated generator rather than the random module's shared instance
+    _choose_tip = random.Random().choice
+
+    # Improved thresholds with more granular levels (call reload_tables() after changing them)
     TRUST_THRESHOLDS = {
         'highly_trusted': 85,
         'trusted': 70,
@@ -38,7 +135,7 @@ class TrustScoreCalculator:
         'highly_risky': 0
     }
 
-    # Scoring weights for different risk factors
+    # Scoring weights for different risk factors (call reload_tables() after changing them)
     SCORING_WEIGHTS = {
         'bias': {
             'high_confidence': 35,
@@ -82,117 +179,241 @@ class TrustScoreCalculator:
         }
     }
 
-    @staticmethod
-    def get_trust_indicator(score: float) -> str:
+    # Per trust level, indexed like _LEVEL_NAMES (see reload_tables)
+    _INDICATORS = (
+        "🔴 Highly Risky", "🔴 Highly Risky", "🔴 Risky", "🟡 High Caution",
+        "🟡 Moderate Caution", "🟢 Trusted", "🟢 Highly Trusted"
+    )
+    _SUMMARY_TEMPLATES = (
+        "This content shows strong signs of bias, manipulation, or misinformation ({risk_count} risk factors).",
+        "This content shows strong signs of bias, manipulation, or misinformation ({risk_count} risk factors).",
+        "This content appears risky with {risk_count} manipulation indicators.",
+        "This content has {risk_count} red flags - approach with significant caution.",
+        "This content shows {risk_count} concerning patterns - verify from other sources.",
+        "This content appears generally trustworthy with {risk_count} minor concerns.",
+        "This content appears highly trustworthy with {risk_count} risk factors detected.",
+    )
+
+    # Pattern scores are tiered low, medium, high by bisect_left over these (exclusive) bounds
+    _PATTERN_SCORE_BOUNDS = (0.4, 0.7)
+
+    # Tips shown for the highest-priority risk factor present
+    CONTEXTUAL_TIPS = {
+        'bias': "Examine if the content fairly represents different viewpoints. Look for balanced reporting that acknowledges complexity.",
+        'emotion': "Be wary of content that uses strong emotions to bypass critical thinking. Question if the emotion is justified by evidence.",
+        'fake_news': "Verify information using the 'SIFT' method: Stop, Investigate the source, Find better coverage, Trace claims to original context.",
+        'nigerian_triggers': "Local expressions can make fake news seem authentic. Verify Nigerian content through multiple local sources.",
+        'clickbait': "Clickbait headlines often exaggerate. Compare headlines with actual article content and check for sensationalism.",
+        'viral_manipulation': "Be skeptical of content designed to trigger immediate sharing. Verify before amplifying, especially urgent-sounding claims.",
+        'sentiment': "Highly polarized content may be designed to create division. Seek balanced perspectives on controversial topics."
+    }
+
+    # Risk factor groups in tip priority order, each with the CONTEXTUAL_TIPS key it selects;
+    # a risk factor belongs to the group of every key its name contains
+    _TIP_BY_RISK_MASK = tuple(
+        (sum(1 << bit for bit, name in enumerate(RiskFactor.NAMES) if tip_key in name), tip_key)
+        for tip_key in ('fake_news', 'bias', 'emotion', 'viral_manipulation', 'nigerian_triggers', 'clickbait',
+                        'sentiment')
+    )
+
+    @classmethod
+    def reload_tables(cls) -> None:
+        """Rebuild the level and deduction tables from TRUST_THRESHOLDS and SCORING_WEIGHTS
+
+        The tables are built once when this module is imported; call this after editing
+        TRUST_THRESHOLDS or SCORING_WEIGHTS for the new values to take effect.
+        """
+        # TRUST_THRESHOLDS in ascending order; bisect_right over it gives the index into _LEVEL_NAMES,
+        # _INDICATORS and _SUMMARY_TEMPLATES (index 0 is for scores under every threshold)
+        levels = sorted(cls.TRUST_THRESHOLDS.items(), key=lambda item: item[1])
+        cls._LEVEL_THRESHOLDS = tuple(threshold for _, threshold in levels)
+        cls._LEVEL_NAMES = ("highly_risky",) + tuple(level for level, _ in levels)
+
+        weights = cls.SCORING_WEIGHTS
+        bias, emotion, sentiment = weights['bias'], weights['emotion'], weights['sentiment']
+        fake_news, viral = weights['fake_news'], weights['viral_manipulation']
+        triggers, clickbait = weights['nigerian_triggers'], weights['clickbait']
+
+        # Tier tables: (threshold, deduction, explanation, risk factor bit), highest threshold first
+        cls._LEGACY_BIAS_TIERS = (
+            (0.8, bias['high_confidence'], "Strong biased language detected.", RiskFactor.STRONG_BIAS),
+            (0.6, bias['moderate'], "Moderate bias detected.", RiskFactor.MODERATE_BIAS),
+            (0.4, bias['mild'], "Mild bias detected.", RiskFactor.MILD_BIAS),
+        )
+        cls._LEGACY_EMOTION_TIERS = (
+            (0.8, emotion['extreme'], "Extremely emotionally charged content.", RiskFactor.EXTREME_EMOTION),
+            (0.6, emotion['strong'], "Strong emotional tone detected.", RiskFactor.STRONG_EMOTION),
+            (0.4, emotion['mild'], "Mild emotional tone detected.", RiskFactor.MILD_EMOTION),
+        )
+
+        # Pattern score tiers (indexed by bisect_left over _PATTERN_SCORE_BOUNDS): low, medium, high
+        cls._TRIGGER_DEDUCTIONS = (triggers['low'], triggers['medium'], triggers['high'])
+        cls._CLICKBAIT_DEDUCTIONS = (clickbait['low'], clickbait['medium'], clickbait['high'])
+
+        # Added on top of the bias level when high-confidence Nigerian detections are present
+        cls._NIGERIAN_BIAS_DEDUCTION = bias['nigerian_specific']
+
+        # Level tables: level -> (deduction, explanation, risk factor bit)
+        cls._BIAS_LEVELS = {
+            'high': (bias['high_confidence'],
+                     "High confidence bias detected with strong language patterns.", RiskFactor.HIGH_BIAS),
+            'medium': (bias['moderate'], "Moderate bias detected in language patterns.", RiskFactor.MODERATE_BIAS),
+            'low': (bias['mild'], "Mild bias detected in language patterns.", RiskFactor.MILD_BIAS),
+        }
+        cls._MANIPULATION_LEVELS = {
+            'high': (emotion['manipulation_high'],
+                     "High emotional manipulation detected.", RiskFactor.EMOTIONAL_MANIPULATION),
+            'medium': (emotion['manipulation_medium'],
+                       "Moderate emotional manipulation detected.", RiskFactor.MODERATE_EMOTIONAL_MANIPULATION),
+        }
+        cls._EMOTIONALLY_CHARGED = (emotion['charged'],
+                                    "Emotionally charged content detected.", RiskFactor.EMOTIONAL_CONTENT)
+        # Sentiment flags, checked in order: sentiment_data key -> level entry
+        cls._SENTIMENT_FLAGS = (
+            ('bias_indicator', (sentiment['negative'],
+                                "Sentiment analysis indicates potential bias.", RiskFactor.SENTIMENT_BIAS)),
+            ('is_polarized', (sentiment['polarized'],
+                              "Highly polarized sentiment detected.", RiskFactor.POLARIZED_CONTENT)),
+        )
+        cls._DIVISIVE_SENTIMENT = (sentiment['divisive'],
+                                   "Divisive sentiment patterns detected.", RiskFactor.DIVISIVE_SENTIMENT)
+        # Positive sentiment is penalised without raising a risk factor
+        cls._LEGACY_SENTIMENT_LEVELS = {
+            'negative': (sentiment['negative'], "Negative sentiment tone detected.", RiskFactor.NEGATIVE_SENTIMENT),
+            'positive': (sentiment['positive_bias'], "Positive sentiment may indicate bias.", 0),
+        }
+        # Unknown fake news risk levels are scored as low
+        cls._FAKE_RISK_LEVELS = {
+            'high': (fake_news['high_risk'], "High risk of fake news detected.", RiskFactor.HIGH_FAKE_RISK),
+            'medium': (fake_news['medium_risk'], "Medium risk of fake news detected.", RiskFactor.MEDIUM_FAKE_RISK),
+            'low': (fake_news['low_risk'], "Low risk suspicious patterns detected.", RiskFactor.LOW_FAKE_RISK),
+        }
+        # Unknown viral manipulation levels are scored as low
+        cls._VIRAL_LEVELS = {
+            'high': (viral['high'], "High viral manipulation tactics detected.", RiskFactor.VIRAL_MANIPULATION),
+            'medium': (viral['medium'], "Moderate viral manipulation tactics detected.", RiskFactor.MILD_VIRAL_MANIPULATION),
+            'low': (viral['low'], "Mild viral manipulation patterns detected.", RiskFactor.LOW_VIRAL_MANIPULATION),
+        }
+
+    @classmethod
+    def get_trust_indicator(cls, score: float) -> str:
         """Get color-coded trust indicator with improved granularity"""
-        if score >= 85:
-            return "🟢 Highly Trusted"
-        elif score >= 70:
-            return "🟢 Trusted"
-        elif score >= 55:
-            return "🟡 Moderate Caution"
-        elif score >= 40:
-            return "🟡 High Caution"
-        elif score >= 25:
-            return "🔴 Risky"
-        else:
-            return "🔴 Highly Risky"
+        return cls._INDICATORS[bisect_right(cls._LEVEL_THRESHOLDS, score)]
 
-    @staticmethod
-    def get_detailed_trust_level(score: float) -> str:
+    @classmethod
+    def get_detailed_trust_level(cls, score: float) -> str:
         """Get detailed trust categorization"""
-        for level, threshold in TrustScoreCalculator.TRUST_THRESHOLDS.items():
-            if score >= threshold:
-                return level
-        return "highly_risky"
+        return cls._LEVEL_NAMES[bisect_right(cls._LEVEL_THRESHOLDS, score)]
 
-    @staticmethod
-    def calculate(bias_score: float, emotion_score: float, sentiment_label: str, text: str,
+    @classmethod
+    def calculate(cls, bias_score: float, emotion_score: float, sentiment_label: str, text: str,
                   emotion_data: Optional[Dict] = None, sentiment_data: Optional[Dict] = None, 
-                  bias_data: Optional[Dict] = None) -> Tuple[float, str, List[str], str, Dict]:
+                  bias_data: Optional[Dict] = None) -> Tuple[float, str, List[str], str, TrustResult]:
         """
         Enhanced trust score calculation with improved logic and weighting
         """
+        # Texts too short to carry trigger, clickbait or viral phrasing get a neutral score
+        if len(text.strip()) < cls.MIN_TEXT_LENGTH:
+            return cls._insufficient_text_result()
+
         # Initialize with perfect score
         base_score = 100.0
-        deductions = []
-        risk_factors = []
         explanation = []
 
-        # Pattern Analysis
-        nigerian_analysis = NigerianPatterns.analyze_patterns(text)
-        fake_detected, fake_details = FakeNewsDetector.detect(text)
-        viral_analysis = ViralityDetector.analyze_virality(text)
+        # Pattern Analysis (all three from one scan of the text)
+        nigerian_analysis, (fake_detected, fake_details), viral_analysis = analyze_all(text)
 
         # === BIAS SCORING (Enhanced) ===
-        bias_deduction = TrustScoreCalculator._calculate_bias_deduction(
-            bias_score, bias_data, deductions, risk_factors, explanation
+        bias_deduction, bias_risks = cls._calculate_bias_deduction(
+            bias_score, bias_data, explanation
         )
 
         # === EMOTION SCORING (Enhanced) ===
-        emotion_deduction = TrustScoreCalculator._calculate_emotion_deduction(
-            emotion_score, emotion_data, deductions, risk_factors, explanation
+        emotion_deduction, emotion_risks = cls._calculate_emotion_deduction(
+            emotion_score, emotion_data, explanation
         )
 
         # === SENTIMENT SCORING (Enhanced) ===
-        sentiment_deduction = TrustScoreCalculator._calculate_sentiment_deduction(
-            sentiment_label, sentiment_data, deductions, risk_factors, explanation
+        sentiment_deduction, sentiment_risks = cls._calculate_sentiment_deduction(
+            sentiment_label, sentiment_data, explanation
         )
 
         # === FAKE NEWS ANALYSIS (Enhanced) ===
-        fake_deduction = TrustScoreCalculator._calculate_fake_news_deduction(
-            fake_detected, fake_details, deductions, risk_factors, explanation
+        fake_deduction, fake_risks = cls._calculate_fake_news_deduction(
+            fake_detected, fake_details, explanation
         )
 
         # === NIGERIAN PATTERN ANALYSIS (Enhanced) ===
-        pattern_deduction = TrustScoreCalculator._calculate_pattern_deduction(
-            nigerian_analysis, deductions, risk_factors, explanation
+        pattern_deduction, pattern_risks = cls._calculate_pattern_deduction(
+            nigerian_analysis, explanation
         )
 
         # === VIRAL MANIPULATION ANALYSIS (Enhanced) ===
-        viral_deduction = TrustScoreCalculator._calculate_viral_deduction(
-            viral_analysis, deductions, risk_factors, explanation
+        viral_deduction, viral_risks = cls._calculate_viral_deduction(
+            viral_analysis, explanation
         )
 
         # === CALCULATE FINAL SCORE ===
-        total_deduction = sum(deductions)
+        total_deduction = (bias_deduction + emotion_deduction + sentiment_deduction
+                           + fake_deduction + pattern_deduction + viral_deduction)
+        risk_mask = bias_risks | emotion_risks | sentiment_risks | fake_risks | pattern_risks | viral_risks
         
         # Apply diminishing returns to prevent over-penalization
-        adjusted_deduction = TrustScoreCalculator._apply_diminishing_returns(total_deduction)
+        adjusted_deduction = cls._apply_diminishing_returns(total_deduction)
         
-        final_score = max(0, min(base_score - adjusted_deduction, 100))
+        # Deductions are never negative, so only the lower bound can be crossed
+        final_score = max(0, base_score - adjusted_deduction)
 
         # === POSITIVE ADJUSTMENTS ===
-        final_score = TrustScoreCalculator._apply_positive_adjustments(
-            final_score, risk_factors, sentiment_label, emotion_data, bias_data, explanation
+        risk_count = RiskFactor.count(risk_mask)
+        final_score = cls._apply_positive_adjustments(
+            final_score, risk_count, sentiment_label, emotion_data, bias_data, explanation
         )
 
-        # Generate results
-        indicator = TrustScoreCalculator.get_trust_indicator(final_score)
-        trust_level = TrustScoreCalculator.get_detailed_trust_level(final_score)
-        tip = TrustScoreCalculator._get_contextual_tip(risk_factors)
-        summary = TrustScoreCalculator._generate_summary(final_score, risk_factors)
-
-        return final_score, indicator, explanation, tip, {
-            'trust_level': trust_level,
-            'risk_factors': risk_factors,
-            'summary': summary,
-            'deductions': deductions,
-            'total_deduction': total_deduction,
-            'adjusted_deduction': adjusted_deduction,
-            'pattern_analysis': {
-                'nigerian_patterns': nigerian_analysis,
-                'fake_news_risk': fake_details if fake_detected else None,
-                'viral_manipulation': viral_analysis if viral_analysis['has_viral_patterns'] else None
-            }
-        }
+        # Generate results (indicator, level and summary share one threshold lookup)
+        level_index = bisect_right(cls._LEVEL_THRESHOLDS, final_score)
+        indicator = cls._INDICATORS[level_index]
+        trust_level = cls._LEVEL_NAMES[level_index]
+        tip = cls._get_contextual_tip(risk_mask)
+        summary = cls._generate_summary(level_index, risk_count)
+
+        return final_score, indicator, explanation, tip, TrustResult(
+            trust_level=trust_level,
+            risk_factors=RiskFactor.names(risk_mask),
+            summary=summary,
+            deductions=[bias_deduction, emotion_deduction, sentiment_deduction,
+                        fake_deduction, pattern_deduction, viral_deduction],
+            total_deduction=total_deduction,
+            adjusted_deduction=adjusted_deduction,
+            pattern_analysis=PatternAnalysis(
+                nigerian_patterns=nigerian_analysis,
+                fake_news_risk=fake_details if fake_detected else None,
+                viral_manipulation=viral_analysis if viral_analysis['has_viral_patterns'] else None
+            )
+        )
+
+    @classmethod
+    def _insufficient_text_result(cls) -> Tuple[float, str, List[str], str, TrustResult]:
+        """Neutral calculate() result for texts too short to analyse"""
+        score = cls.INSUFFICIENT_TEXT_SCORE
+        level_index = bisect_right(cls._LEVEL_THRESHOLDS, score)
+        return score, cls._INDICATORS[level_index], ["Insufficient text for analysis."], \
+            cls._choose_tip(cls.DID_YOU_KNOW_TIPS), TrustResult(
+                trust_level=cls._LEVEL_NAMES[level_index],
+                risk_factors=[],
+                summary=cls._generate_summary(level_index, 0),
+                deductions=[0.0] * 6,
+                total_deduction=0.0,
+                adjusted_deduction=0.0,
+                pattern_analysis=copy.deepcopy(cls._EMPTY_PATTERN_ANALYSIS)
+            )
 
     @staticmethod
     def _calculate_bias_deduction(bias_score: float, bias_data: Optional[Dict], 
-                                deductions: List[float], risk_factors: List[str], 
-                                explanation: List[str]) -> float:
-        """Calculate bias-related score deductions"""
+                                explanation: List[str]) -> Tuple[float, int]:
+        """Calculate bias-related score deductions; returns the deduction and the risk factor bits raised"""
         deduction = 0.0
+        risk_mask = 0
         
         if bias_data and 'flag' in bias_data:
             if bias_data['flag']:
@@ -201,27 +422,26 @@ class TrustScoreCalculator:
                 bias_level = bias_data.get('bias_level', 'low')
                 
                 if bias_level == 'high' or confidence_level > 0.8:
-                    deduction = TrustScoreCalculator.SCORING_WEIGHTS['bias']['high_confidence']
-                    explanation.append("High confidence bias detected with strong language patterns.")
-                    risk_factors.append("high_bias")
+                    bias_level = 'high'
                 elif bias_level == 'medium' or confidence_level > 0.6:
-                    deduction = TrustScoreCalculator.SCORING_WEIGHTS['bias']['moderate']
-                    explanation.append("Moderate bias detected in language patterns.")
-                    risk_factors.append("moderate_bias")
+                    bias_level = 'medium'
                 else:
-                    deduction = TrustScoreCalculator.SCORING_WEIGHTS['bias']['mild']
-                    explanation.append("Mild bias detected in language patterns.")
-                    risk_factors.append("mild_bias")
+                    bias_level = 'low'
+                deduction, risk_mask = TrustScoreCalculator._apply_level(
+                    TrustScoreCalculator._BIAS_LEVELS[bias_level], explanation
+                )
 
                 # Additional penalty for Nigerian-specific bias
                 nigerian_detections = bias_data.get('nigerian_detections', [])
                 if nigerian_detections:
-                    high_confidence_nigerian = [d for d in nigerian_detections if d.get('confidence', 0) > 0.7]
-                    if high_confidence_nigerian:
-                        additional_deduction = TrustScoreCalculator.SCORING_WEIGHTS['bias']['nigerian_specific']
-                        deduction += additional_deduction
-                        explanation.append(f"Nigerian-specific bias detected: {', '.join([d.get('term', '') for d in high_confidence_nigerian[:2]])}")
-                        risk_factors.append("nigerian_bias")
+                    # Only the first two high-confidence terms are reported, so stop looking after two
+                    top_terms = list(islice(
+                        (d.get('term', '') for d in nigerian_detections if d.get('confidence', 0) > 0.7), 2
+                    ))
+                    if top_terms:
+                        deduction += TrustScoreCalculator._NIGERIAN_BIAS_DEDUCTION
+                        explanation.append(f"Nigerian-specific bias detected: {', '.join(top_terms)}")
+                        risk_mask |= RiskFactor.NIGERIAN_BIAS
 
                 # Bias type information
                 bias_type = bias_data.get('type_analysis', {}).get('type')
@@ -230,190 +450,129 @@ class TrustScoreCalculator:
                     
         else:
             # Fallback to legacy scoring
-            if bias_score >= 0.8:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['bias']['high_confidence']
-                explanation.append("Strong biased language detected.")
-                risk_factors.append("strong_bias")
-            elif bias_score >= 0.6:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['bias']['moderate']
-                explanation.append("Moderate bias detected.")
-                risk_factors.append("moderate_bias")
-            elif bias_score >= 0.4:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['bias']['mild']
-                explanation.append("Mild bias detected.")
-                risk_factors.append("mild_bias")
-
-        deductions.append(deduction)
-        return deduction
+            deduction, risk_mask = TrustScoreCalculator._apply_tier(
+                bias_score, TrustScoreCalculator._LEGACY_BIAS_TIERS, explanation
+            )
+
+        return deduction, risk_mask
 
     @staticmethod
     def _calculate_emotion_deduction(emotion_score: float, emotion_data: Optional[Dict], 
-                                   deductions: List[float], risk_factors: List[str], 
-                                   explanation: List[str]) -> float:
-        """Calculate emotion-related score deductions"""
+                                   explanation: List[str]) -> Tuple[float, int]:
+        """Calculate emotion-related score deductions; returns the deduction and the risk factor bits raised"""
         deduction = 0.0
+        risk_mask = 0
         
         if emotion_data:
             manipulation_risk = emotion_data.get('manipulation_risk', 'minimal')
             is_charged = emotion_data.get('is_emotionally_charged', False)
             
-            if manipulation_risk == 'high':
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['emotion']['manipulation_high']
-                explanation.append("High emotional manipulation detected.")
-                risk_factors.append("emotional_manipulation")
-            elif manipulation_risk == 'medium':
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['emotion']['manipulation_medium']
-                explanation.append("Moderate emotional manipulation detected.")
-                risk_factors.append("moderate_emotional_manipulation")
-            elif is_charged:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['emotion']['charged']
-                explanation.append("Emotionally charged content detected.")
-                risk_factors.append("emotional_content")
+            level = TrustScoreCalculator._MANIPULATION_LEVELS.get(manipulation_risk)
+            if level is None and is_charged:
+                level = TrustScoreCalculator._EMOTIONALLY_CHARGED
+            if level is not None:
+                deduction, risk_mask = TrustScoreCalculator._apply_level(level, explanation)
                 
         else:
             # Legacy emotion scoring
-            if emotion_score >= 0.8:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['emotion']['extreme']
-                explanation.append("Extremely emotionally charged content.")
-                risk_factors.append("extreme_emotion")
-            elif emotion_score >= 0.6:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['emotion']['strong']
-                explanation.append("Strong emotional tone detected.")
-                risk_factors.append("strong_emotion")
-            elif emotion_score >= 0.4:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['emotion']['mild']
-                explanation.append("Mild emotional tone detected.")
-                risk_factors.append("mild_emotion")
-
-        deductions.append(deduction)
-        return deduction
+            deduction, risk_mask = TrustScoreCalculator._apply_tier(
+                emotion_score, TrustScoreCalculator._LEGACY_EMOTION_TIERS, explanation
+            )
+
+        return deduction, risk_mask
 
     @staticmethod
     def _calculate_sentiment_deduction(sentiment_label: str, sentiment_data: Optional[Dict], 
-                                     deductions: List[float], risk_factors: List[str], 
-                                     explanation: List[str]) -> float:
-        """Calculate sentiment-related score deductions"""
+                                     explanation: List[str]) -> Tuple[float, int]:
+        """Calculate sentiment-related score deductions; returns the deduction and the risk factor bits raised"""
         deduction = 0.0
+        risk_mask = 0
         
         if sentiment_data:
-            if sentiment_data.get('bias_indicator', False):
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['sentiment']['negative']
-                explanation.append("Sentiment analysis indicates potential bias.")
-                risk_factors.append("sentiment_bias")
-
-            if sentiment_data.get('is_polarized', False):
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['sentiment']['polarized']
-                explanation.append("Highly polarized sentiment detected.")
-                risk_factors.append("polarized_content")
-
-            polarization = sentiment_data.get('polarization_score', 0)
-            if polarization > 0.7:
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['sentiment']['divisive']
-                explanation.append("Divisive sentiment patterns detected.")
-                risk_factors.append("divisive_sentiment")
+            get = sentiment_data.get
+            levels = [level for key, level in TrustScoreCalculator._SENTIMENT_FLAGS if get(key, False)]
+            if get('polarization_score', 0) > 0.7:
+                levels.append(TrustScoreCalculator._DIVISIVE_SENTIMENT)
+            for level_deduction, message, risk_bit in levels:
+                deduction += level_deduction
+                explanation.append(message)
+                risk_mask |= risk_bit
                 
         else:
-            # Legacy sentiment scoring
-            if sentiment_label == 'negative':
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['sentiment']['negative']
-                explanation.append("Negative sentiment tone detected.")
-                risk_factors.append("negative_sentiment")
-            elif sentiment_label == 'positive':
-                # Even positive sentiment can indicate bias
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['sentiment']['positive_bias']
-                explanation.append("Positive sentiment may indicate bias.")
-
-        deductions.append(deduction)
-        return deduction
+            # Legacy sentiment scoring (even positive sentiment can indicate bias)
+            level = TrustScoreCalculator._LEGACY_SENTIMENT_LEVELS.get(sentiment_label)
+            if level is not None:
+                deduction, risk_mask = TrustScoreCalculator._apply_level(level, explanation)
+
+        return deduction, risk_mask
 
     @staticmethod
     def _calculate_fake_news_deduction(fake_detected: bool, fake_details: Dict, 
-                                     deductions: List[float], risk_factors: List[str], 
-                                     explanation: List[str]) -> float:
-        """Calculate fake news related deductions"""
+                                     explanation: List[str]) -> Tuple[float, int]:
+        """Calculate fake news related deductions; returns the deduction and the risk factor bits raised"""
         deduction = 0.0
+        risk_mask = 0
         
         if fake_detected:
-            risk_level = fake_details.get('risk_level', 'medium')
-            
-            if risk_level == 'high':
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['fake_news']['high_risk']
-                explanation.append("High risk of fake news detected.")
-                risk_factors.append("high_fake_risk")
-            elif risk_level == 'medium':
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['fake_news']['medium_risk']
-                explanation.append("Medium risk of fake news detected.")
-                risk_factors.append("medium_fake_risk")
-            else:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['fake_news']['low_risk']
-                explanation.append("Low risk suspicious patterns detected.")
-                risk_factors.append("low_fake_risk")
-
-            # Add specific patterns to explanation
-            if fake_details.get('fake_matches'):
-                top_matches = list(set(fake_details['fake_matches'][:3]))
-                explanation.append(f"Suspicious phrases: {', '.join(top_matches)}")
-
-        deductions.append(deduction)
-        return deduction
+            levels = TrustScoreCalculator._FAKE_RISK_LEVELS
+            level = levels.get(fake_details.get('risk_level', 'medium'), levels['low'])
+            deduction, risk_mask = TrustScoreCalculator._apply_level(level, explanation)
+
+            # Add specific patterns to explanation (first three, duplicates dropped, in text order)
+            fake_matches = fake_details.get('fake_matches')
+            if fake_matches:
+                explanation.append(f"Suspicious phrases: {', '.join(dict.fromkeys(fake_matches[:3]))}")
+
+        return deduction, risk_mask
 
     @staticmethod
-    def _calculate_pattern_deduction(nigerian_analysis: Dict, deductions: List[float], 
-                                   risk_factors: List[str], explanation: List[str]) -> float:
-        """Calculate Nigerian pattern related deductions"""
+    def _calculate_pattern_deduction(nigerian_analysis: Dict, explanation: List[str]) -> Tuple[float, int]:
+        """Calculate Nigerian pattern related deductions; returns the deduction and the risk factor bits raised"""
         deduction = 0.0
+        risk_mask = 0
+        
+        bounds = TrustScoreCalculator._PATTERN_SCORE_BOUNDS
         
         if nigerian_analysis['has_triggers']:
-            trigger_score = nigerian_analysis['trigger_score']
-            if trigger_score > 0.7:
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['nigerian_triggers']['high']
-            elif trigger_score > 0.4:
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['nigerian_triggers']['medium']
-            else:
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['nigerian_triggers']['low']
-                
+            deduction += TrustScoreCalculator._TRIGGER_DEDUCTIONS[bisect_left(bounds, nigerian_analysis['trigger_score'])]
             explanation.append("Nigerian trigger phrases commonly used in misleading content.")
-            risk_factors.append("nigerian_triggers")
+            risk_mask |= RiskFactor.NIGERIAN_TRIGGERS
 
         if nigerian_analysis['has_clickbait']:
-            clickbait_score = nigerian_analysis['clickbait_score']
-            if clickbait_score > 0.7:
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['clickbait']['high']
-            elif clickbait_score > 0.4:
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['clickbait']['medium']
-            else:
-                deduction += TrustScoreCalculator.SCORING_WEIGHTS['clickbait']['low']
-                
+            deduction += TrustScoreCalculator._CLICKBAIT_DEDUCTIONS[bisect_left(bounds, nigerian_analysis['clickbait_score'])]
             explanation.append("Clickbait patterns designed to attract clicks.")
-            risk_factors.append("clickbait")
+            risk_mask |= RiskFactor.CLICKBAIT
 
-        deductions.append(deduction)
-        return deduction
+        return deduction, risk_mask
 
     @staticmethod
-    def _calculate_viral_deduction(viral_analysis: Dict, deductions: List[float], 
-                                 risk_factors: List[str], explanation: List[str]) -> float:
-        """Calculate viral manipulation related deductions"""
+    def _calculate_viral_deduction(viral_analysis: Dict, explanation: List[str]) -> Tuple[float, int]:
+        """Calculate viral manipulation related deductions; returns the deduction and the risk factor bits raised"""
         deduction = 0.0
+        risk_mask = 0
         
         if viral_analysis['has_viral_patterns']:
-            manipulation_level = viral_analysis.get('manipulation_level', 'low')
-            
-            if manipulation_level == 'high':
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['viral_manipulation']['high']
-                explanation.append("High viral manipulation tactics detected.")
-                risk_factors.append("viral_manipulation")
-            elif manipulation_level == 'medium':
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['viral_manipulation']['medium']
-                explanation.append("Moderate viral manipulation tactics detected.")
-                risk_factors.append("mild_viral_manipulation")
-            else:
-                deduction = TrustScoreCalculator.SCORING_WEIGHTS['viral_manipulation']['low']
-                explanation.append("Mild viral manipulation patterns detected.")
-                risk_factors.append("low_viral_manipulation")
-
-        deductions.append(deduction)
-        return deduction
+            levels = TrustScoreCalculator._VIRAL_LEVELS
+            level = levels.get(viral_analysis.get('manipulation_level', 'low'), levels['low'])
+            deduction, risk_mask = TrustScoreCalculator._apply_level(level, explanation)
+
+        return deduction, risk_mask
+
+    @staticmethod
+    def _apply_tier(value: float, tiers: Tuple, explanation: List[str]) -> Tuple[float, int]:
+        """Apply the first tier whose threshold value reaches; (0.0, 0) when none does"""
+        for threshold, deduction, message, risk_bit in tiers:
+            if value >= threshold:
+                explanation.append(message)
+                return deduction, risk_bit
+        return 0.0, 0
+
+    @staticmethod
+    def _apply_level(level: Tuple, explanation: List[str]) -> Tuple[float, int]:
+        """Record a (deduction, explanation, risk factor bit) level entry and return its deduction and bit"""
+        deduction, message, risk_bit = level
+        explanation.append(message)
+        return deduction, risk_bit
 
     @staticmethod
     def _apply_diminishing_returns(total_deduction: float) -> float:
@@ -428,67 +587,48 @@ class TrustScoreCalculator:
             return 50 + 30 * 0.7 + (total_deduction - 80) * 0.5
 
     @staticmethod
-    def _apply_positive_adjustments(score: float, risk_factors: List[str], sentiment_label: str,
+    def _apply_positive_adjustments(score: float, risk_count: int, sentiment_label: str,
                                   emotion_data: Optional[Dict], bias_data: Optional[Dict], 
                                   explanation: List[str]) -> float:
         """Apply positive adjustments for high-quality content"""
+        if risk_count > 2:
+            return score
+
         bonus = 0
-        
-        # Bonus for truly neutral, well-balanced content
         is_neutral_sentiment = sentiment_label == 'neutral'
-        is_minimal_emotion = (not emotion_data or 
-                            (emotion_data.get('manipulation_risk', 'minimal') == 'minimal' and 
-                             not emotion_data.get('is_emotionally_charged', False)))
-        is_unbiased = (not bias_data or not bias_data.get('flag', False))
-        
-        if len(risk_factors) == 0 and is_neutral_sentiment and is_minimal_emotion and is_unbiased:
+
+        # Bonus for truly neutral, well-balanced content (emotion and bias data are
+        # only inspected once the cheaper conditions hold)
+        if (risk_count == 0 and is_neutral_sentiment
+                and (not emotion_data or
+                     (emotion_data.get('manipulation_risk', 'minimal') == 'minimal' and
+                      not emotion_data.get('is_emotionally_charged', False)))
+                and (not bias_data or not bias_data.get('flag', False))):
             bonus += 8
             explanation.append("Content appears balanced and factual.")
-        elif len(risk_factors) <= 1 and is_neutral_sentiment:
+        elif risk_count <= 1 and is_neutral_sentiment:
             bonus += 4
             explanation.append("Content shows good neutrality.")
-        elif len(risk_factors) <= 2:
+        elif risk_count <= 2:
             bonus += 2
             explanation.append("Content has minimal risk factors.")
 
         return min(score + bonus, 100)
 
     @staticmethod
-    def _get_contextual_tip(risk_factors: List[str]) -> str:
+    def _get_contextual_tip(risk_mask: int) -> str:
         """Get contextual tip based on detected risk factors"""
-        contextual_tips = {
-            'bias': "Examine if the content fairly represents different viewpoints. Look for balanced reporting that acknowledges complexity.",
-            'emotion': "Be wary of content that uses strong emotions to bypass critical thinking. Question if the emotion is justified by evidence.",
-            'fake_news': "Verify information using the 'SIFT' method: Stop, Investigate the source, Find better coverage, Trace claims to original context.",
-            'nigerian_triggers': "Local expressions can make fake news seem authentic. Verify Nigerian content through multiple local sources.",
-            'clickbait': "Clickbait headlines often exaggerate. Compare headlines with actual article content and check for sensationalism.",
-            'viral_manipulation': "Be skeptical of content designed to trigger immediate sharing. Verify before amplifying, especially urgent-sounding claims.",
-            'sentiment': "Highly polarized content may be designed to create division. Seek balanced perspectives on controversial topics."
-        }
-
-        # Priority order for tip selection
-        tip_priorities = ['fake_news', 'bias', 'emotion', 'viral_manipulation', 'nigerian_triggers', 'clickbait', 'sentiment']
+        for group_mask, tip_key in TrustScoreCalculator._TIP_BY_RISK_MASK:
+            if risk_mask & group_mask:
+                return TrustScoreCalculator.CONTEXTUAL_TIPS[tip_key]
         
-        for priority in tip_priorities:
-            if any(priority in rf for rf in risk_factors):
-                return contextual_tips[priority]
-        
-        return random.choice(TrustScoreCalculator.DID_YOU_KNOW_TIPS)
+        return TrustScoreCalculator._choose_tip(TrustScoreCalculator.DID_YOU_KNOW_TIPS)
 
     @staticmethod
-    def _generate_summary(score: float, risk_factors: List[str]) -> str:
-        """Generate human-readable summary with context"""
-        risk_count = len(risk_factors)
-        
-        if score >= 85:
-            return f"This content appears highly trustworthy with {risk_count} risk factors detected."
-        elif score >= 70:
-            return f"This content appears generally trustworthy with {risk_count} minor concerns."
-        elif score >= 55:
-            return f"This content shows {risk_count} concerning patterns - verify from other sources."
-        elif score >= 40:
-            return f"This content has {risk_count} red flags - approach with significant caution."
-        elif score >= 25:
-            return f"This content appears risky with {risk_count} manipulation indicators."
-        else:
-            return f"This content shows strong signs of bias, manipulation, or misinformation ({risk_count} risk factors)."
\ No newline at end of file
+    @lru_cache(maxsize=None)  # at most 7 levels x 24 risk counts
+    def _generate_summary(level_index: int, risk_count: int) -> str:
+        """Generate human-readable summary with context for a trust level index"""
+        return TrustScoreCalculator._SUMMARY_TEMPLATES[level_index].format(risk_count=risk_count)
+
+
+TrustScoreCalculator.reload_tables()
@@ -1,2 +1,266 @@
+import copy
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
+
 # Shared model cache
 _model_cache = {}
+# Shared rule-based analyzers (one NigerianContextAnalyzer per process)
+_analyzer_cache = {}
+# Serializes first-time loads so concurrent constructors never load the same model twice
+_model_cache_lock = threading.Lock()
+# Long-lived worker pools, keyed by name, for callers that run models side by side
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_or_load_model(cache_key, loader):
+    """Return the cached entry for cache_key, calling loader() at most once per key"""
+    entry = _model_cache.get(cache_key)
+    if entry is None:
+        with _model_cache_lock:
+            # Re-check after acquiring the lock: another thread may have loaded it
+            entry = _model_cache.get(cache_key)
+            if entry is None:
+                entry = loader()
+                _model_cache[cache_key] = entry
+    return entry
+
+
+def shared_executor(name, max_workers):
+    """Return the process-wide thread pool registered under name, creating it on first use"""
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"biaslens-{name}")
+                _executors[name] = executor
+    return executor
+
+
+def limit_torch_threads(concurrent_models):
+    """Cap torch's intra-op threads so concurrent_models models running at once share the CPU cores"""
+    import torch
+
+    threads = max(1, (os.cpu_count() or 1) // concurrent_models)
+    # Only ever lower the setting, so callers asking for different splits never oversubscribe
+    if torch.get_num_threads() > threads:
+        torch.set_num_threads(threads)
+
+
+class ResultCache:
+    """Thread-safe LRU of per-text classifier results; maxsize=0 disables it"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a copy of the cached result for key, or None"""
+        if self.maxsize <= 0:
+            return None
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                return None
+            self._entries.move_to_end(key)
+        # Callers are free to mutate their result, so never hand out the cached dict itself
+        return copy.deepcopy(result)
+
+    def put(self, key, result):
+        """Store a copy of result under key, evicting the least recently used entry"""
+        if self.maxsize <= 0:
+            return
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+
+
+def load_fast_tokenizer(model_name, **kwargs):
+    """Load the Rust-backed tokenizer for model_name, warning when only a slow one exists"""
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True, **kwargs)
+    if not getattr(tokenizer, "is_fast", False):
+        logger.warning("No fast tokenizer available for %s; falling back to the slow Python tokenizer", model_name)
+    return tokenizer
+
+
+def int8_enabled():
+    """Whether dynamic int8 quantization is requested via BIASLENS_INT8=1"""
+    return os.environ.get("BIASLENS_INT8") == "1"
+
+
+def quantize_dynamic_int8(model):
+    """Quantize a model's Linear layers to int8 for CPU inference"""
+    import torch
+
+    # fbgemm targets x86, qnnpack targets ARM
+    engines = torch.backends.quantized.supported_engines
+    if "fbgemm" in engines:
+        torch.backends.quantized.engine = "fbgemm"
+    elif "qnnpack" in engines:
+        torch.backends.quantized.engine = "qnnpack"
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _export_name(model_name, quantized):
+    """Cache-dir file stem for a model: a hash of its name, suffixed for int8 variants"""
+    digest = hashlib.sha1(model_name.encode("utf-8")).hexdigest()[:16]
+    return f"{digest}-int8" if quantized else digest
+
+
+def _cache_dir():
+    return os.environ.get("BIASLENS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "biaslens"))
+
+
+def onnx_export_dir(model_name, quantized=False):
+    """On-disk location of a model's ONNX export, keyed by a hash of the model name"""
+    return os.path.join(_cache_dir(), "onnx", _export_name(model_name, quantized))
+
+
+# Sequence length TorchScript traces are specialised to; shorter inputs are padded up to it
+TORCHSCRIPT_MAX_LENGTH = 512
+
+
+def torchscript_path(model_name, quantized=False):
+    """On-disk location of a model's frozen TorchScript trace
+
+    Keyed by a hash of the model name, the torch version that traced it and the traced sequence
+    length, so upgrading torch or changing the trace never loads a stale file.
+    """
+    import torch
+
+    trace_key = f"{model_name}@torch-{torch.__version__}@{TORCHSCRIPT_MAX_LENGTH}"
+    return os.path.join(_cache_dir(), "torchscript", _export_name(trace_key, quantized) + ".pt")
+
+
+def load_onnx_classifier(model_name, quantize=False):
+    """Load an ONNX Runtime sequence classifier, exporting (and int8-quantizing) it on first use"""
+    # Optional dependency, only required for the ONNX Runtime path
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    save_dir = onnx_export_dir(model_name, quantize)
+    file_name = "model_quantized.onnx" if quantize else "model.onnx"
+    if not os.path.exists(os.path.join(save_dir, file_name)):
+        model = ORTModelForSequenceClassification.from_pretrained(
+            model_name, export=True, provider="CPUExecutionProvider"
+        )
+        if quantize:
+            ORTQuantizer.from_pretrained(model).quantize(
+                save_dir=save_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            )
+        else:
+            model.save_pretrained(save_dir)
+    return ORTModelForSequenceClassification.from_pretrained(
+        save_dir, file_name=file_name, provider="CPUExecutionProvider"
+    )
+
+
+class TorchScriptClassifier:
+    """Calls a traced sequence classifier like a transformers model (outputs expose .logits)
+
+    The trace only holds for the sequence length it was recorded at, so every batch is padded
+    (masked out) up to TORCHSCRIPT_MAX_LENGTH first.
+    """
+
+    def __init__(self, traced, pad_token_id):
+        self.traced = traced
+        self.pad_token_id = pad_token_id
+
+    def __call__(self, input_ids, attention_mask, **_):
+        import torch.nn.functional as F
+
+        padding = TORCHSCRIPT_MAX_LENGTH - input_ids.shape[1]
+        if padding > 0:
+            input_ids = F.pad(input_ids, (0, padding), value=self.pad_token_id)
+            attention_mask = F.pad(attention_mask, (0, padding), value=0)
+        return SimpleNamespace(logits=self.traced(input_ids, attention_mask)[0])
+
+
+def load_torchscript_classifier(model_name, tokenizer, quantize=False, model_class=None):
+    """Load a frozen TorchScript sequence classifier, tracing (and int8-quantizing) it on first use"""
+    import torch
+
+    if model_class is None:
+        from transformers import AutoModelForSequenceClassification as model_class
+
+    path = torchscript_path(model_name, quantize)
+    if os.path.exists(path):
+        traced = torch.jit.load(path)
+    else:
+        model = model_class.from_pretrained(model_name, torchscript=True)
+        model.eval()
+        if quantize:
+            model = quantize_dynamic_int8(model)
+        example = tokenizer("warmup text", return_tensors="pt", padding="max_length",
+                            max_length=TORCHSCRIPT_MAX_LENGTH)
+        with torch.no_grad():
+            traced = torch.jit.trace(model, (example["input_ids"], example["attention_mask"]), strict=False)
+            traced = torch.jit.freeze(traced.eval())
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        torch.jit.save(traced, path)
+    return TorchScriptClassifier(traced, tokenizer.pad_token_id or 0)
+
+
+def load_sequence_classifier(model_class, model_name, use_onnx=False, quantize_onnx=False, use_torchscript=False,
+                             tokenizer_loader=load_fast_tokenizer):
+    """Cache key and shared {"tokenizer", "model", "device"} entry for a sequence classifier
+
+    ONNX Runtime exports, TorchScript traces and int8 models (BIASLENS_INT8=1) are cached
+    separately from the plain PyTorch model.
+    """
+    if use_onnx:
+        use_int8 = False
+        cache_key = f"{model_name}::onnx-int8" if quantize_onnx else f"{model_name}::onnx"
+    else:
+        use_int8 = int8_enabled()
+        cache_key = f"{model_name}::torchscript" if use_torchscript else model_name
+        if use_int8:
+            cache_key += "::int8"
+
+    def load():
+        import torch
+
+        tokenizer = tokenizer_loader(model_name)
+        device = "cpu"
+        if use_onnx:
+            model = load_onnx_classifier(model_name, quantize=quantize_onnx)
+        elif use_torchscript:
+            # Traced once and frozen on disk; the trace runs on the CPU
+            model = load_torchscript_classifier(model_name, tokenizer, quantize=use_int8, model_class=model_class)
+        else:
+            model = model_class.from_pretrained(model_name)
+            model.eval()
+            if torch.cuda.is_available():
+                # Weights stay fp32 on the GPU; the forward pass runs under fp16 autocast
+                device = "cuda"
+                model.to(device)
+            elif use_int8:
+                # Dynamic int8 quantization is a CPU-only path
+                model = quantize_dynamic_int8(model)
+        return {
+            "tokenizer": tokenizer,
+            "model": model,
+            "device": device,
+        }
+
+    return cache_key, get_or_load_model(cache_key, load)
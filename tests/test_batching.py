@@ -0,0 +1,139 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from types import SimpleNamespace
+
+from biaslens import analyzer, emotion, sentiment
+from biaslens.bias import BiasLensAnalyzer, EnhancedBiasDetector, EnhancedBiasTypeClassifier
+from biaslens.trust import TrustScoreCalculator
+from biaslens.utils import ResultCache
+
+
+# Duplicates and lengths out of order, with and without Nigerian context
+TEXTS = [
+    "w1 w2 w3 w4 w5 w6 w7 w8 w9 w10 w11 w12 the committee met to review the budget",
+    "w7 w7 w3 a short note on rainfall",
+    "Those greedy igbo traders and the yoruba agenda w5 w9",
+    "w1 w2 w3 w4 w5 w6 w7 w8 w9 w10 w11 w12 the committee met to review the budget",
+    "w40 w41 the senate passed the bill",
+    "w7 w7 w3 a short note on rainfall",
+]
+
+
+class CountingModel:
+    """Stub sequence classifier: logits are word counts times fixed integer weights, scaled by a power
+    of two, so every row is exact and does not depend on the padding of the rest of the batch"""
+
+    def __init__(self, vocab_size, num_labels):
+        self.weights = (torch.arange(vocab_size * num_labels).reshape(vocab_size, num_labels) % 7 - 3).float()
+        self.batch_sizes = []
+
+    def __call__(self, input_ids, attention_mask, **kwargs):
+        self.batch_sizes.append(len(input_ids))
+        counts = torch.zeros(len(input_ids), len(self.weights), dtype=torch.long)
+        counts.scatter_add_(1, input_ids, attention_mask.long())
+        return SimpleNamespace(logits=(counts.float() @ self.weights) / 8)
+
+
+@pytest.fixture
+def tokenizer(tmp_path):
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [f"w{i}" for i in range(50)]
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab))
+    return transformers.BertTokenizerFast(vocab_file=str(vocab_file))
+
+
+def _stub_loader(tokenizer, num_labels):
+    def load(*args, **kwargs):
+        model = CountingModel(tokenizer.vocab_size, num_labels)
+        return "stub", {"tokenizer": tokenizer, "model": model, "device": "cpu"}
+    return load
+
+
+@pytest.fixture
+def emotion_classifier(tokenizer, monkeypatch):
+    monkeypatch.setattr(emotion, "load_sequence_classifier", _stub_loader(tokenizer, 6))
+    monkeypatch.setattr(emotion, "_result_cache", ResultCache(0))
+    return emotion.EmotionClassifier()
+
+
+@pytest.fixture
+def sentiment_analyzer(tokenizer, monkeypatch):
+    monkeypatch.setattr(sentiment, "load_sequence_classifier", _stub_loader(tokenizer, 3))
+    monkeypatch.setattr(sentiment, "_result_cache", ResultCache(0))
+    return sentiment.SentimentAnalyzer()
+
+
+def _stub_pipeline(texts, batch_size, truncation):
+    return [{"label": "TOXIC" if len(text) % 2 else "NON_TOXIC", "score": len(text) % 10 / 10} for text in texts]
+
+
+def _stub_zero_shot(texts, labels, batch_size):
+    results = []
+    for text in texts:
+        shift = len(text) % len(labels)
+        results.append({"labels": labels[shift:] + labels[:shift], "scores": [0.6, 0.2, 0.1, 0.05, 0.03, 0.01, 0.01]})
+    return results
+
+
+@pytest.fixture
+def bias_analyzer():
+    bias_analyzer = BiasLensAnalyzer(cache_size=0)
+    bias_analyzer.bias_detector._pipeline = _stub_pipeline
+    bias_analyzer.bias_classifier._classifier = _stub_zero_shot
+    return bias_analyzer
+
+
+def test_emotion_classify_batch_matches_classify(emotion_classifier):
+    assert emotion_classifier.classify_batch(TEXTS) == [emotion_classifier.classify(text) for text in TEXTS]
+
+
+def test_sentiment_analyze_batch_matches_analyze(sentiment_analyzer):
+    texts = TEXTS + ["", "ok"]
+
+    assert sentiment_analyzer.analyze_batch(texts) == [sentiment_analyzer.analyze(text) for text in texts]
+
+
+def test_duplicates_in_a_batch_share_one_row(emotion_classifier):
+    results = emotion_classifier.classify_batch(TEXTS)
+
+    assert emotion_classifier.model.batch_sizes == [len(set(TEXTS))]
+    assert results[0] == results[3] and results[0] is not results[3]
+
+
+def test_detect_batch_restores_input_order():
+    detector = EnhancedBiasDetector()
+    detector._pipeline = _stub_pipeline
+
+    assert detector.detect_batch(TEXTS) == [detector.detect(text) for text in TEXTS]
+
+
+def test_predict_batch_matches_predict():
+    classifier = EnhancedBiasTypeClassifier()
+    classifier._classifier = _stub_zero_shot
+
+    assert classifier.predict_batch(TEXTS) == [classifier.predict(text) for text in TEXTS]
+
+
+def test_bias_analyze_batch_matches_analyze(bias_analyzer):
+    texts = TEXTS + ["short", "   "]
+
+    assert bias_analyzer.analyze_batch(texts) == [bias_analyzer.analyze(text) for text in texts]
+
+
+def test_analyse_batch_matches_analyse_with_empty_entries(emotion_classifier, sentiment_analyzer, bias_analyzer,
+                                                         monkeypatch):
+    monkeypatch.setattr(TrustScoreCalculator, "_choose_tip", staticmethod(lambda tips: tips[0]))
+    biaslens = analyzer.BiasLensAnalyzer()
+    biaslens._emotion_classifier = emotion_classifier
+    biaslens._sentiment_analyzer = sentiment_analyzer
+    biaslens._new_bias_analyzer = bias_analyzer
+    texts = ["", TEXTS[0], "   ", TEXTS[2], TEXTS[0], None]
+
+    batch = biaslens.analyse_batch(texts, include_detailed_results=True)
+
+    assert batch == [biaslens.analyse(text, include_detailed_results=True) for text in texts]
+    assert batch[0]["indicator"] == batch[2]["indicator"] == batch[5]["indicator"] == "Error"
+    assert batch[1]["trust_score"] is not None
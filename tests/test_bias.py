@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from biaslens.bias import BiasLensAnalyzer, EnhancedBiasDetector
+
+
+def test_detect_batch_error_does_not_leave_the_sweep_running():
+    detector = EnhancedBiasDetector()
+    started = threading.Event()
+    finished = []
+
+    def sweep(texts):
+        started.set()
+        time.sleep(0.05)
+        finished.append(True)
+        return [[] for _ in texts]
+
+    def failing_pipeline(*args, **kwargs):
+        started.wait(1)
+        raise RuntimeError("model failed")
+
+    detector._analyze_nigerian_batch = sweep
+    detector._pipeline = failing_pipeline
+
+    results = detector.detect_batch(["first text to check", "second text to check"])
+
+    assert [r["error"] for r in results] == ["Analysis failed: model failed"] * 2
+    # The sweep had started, so detect_batch waited for it before returning
+    assert finished == [True]
+
+
+def test_type_classifier_error_is_not_cached():
+    analyzer = BiasLensAnalyzer()
+    calls = []
+
+    def zero_shot(texts, labels, batch_size):
+        calls.append(texts)
+        if len(calls) == 1:
+            raise RuntimeError("model failed")
+        return [{"labels": ["social bias"] + labels[:2], "scores": [0.8, 0.1, 0.1]} for _ in texts]
+
+    analyzer.bias_detector.detect_batch = lambda texts, nigerian_detections=None: [
+        {"is_biased": False, "confidence": 10.0, "bias_level": "minimal"} for _ in texts
+    ]
+    analyzer.bias_classifier._classifier = zero_shot
+    text = "The committee published its yearly report on rainfall"
+
+    assert analyzer.analyze(text)["bias_details"]["type"] == "analysis_error"
+    assert analyzer.analyze(text)["bias_details"]["type"] == "social bias"
+    assert len(calls) == 2
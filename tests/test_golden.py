@@ -0,0 +1,150 @@
+"""Golden outputs for the rule-based analyses and the trust score
+
+The expected values live in tests/golden/outputs.json. After an intentional behaviour change,
+regenerate them with BIASLENS_UPDATE_GOLDEN=1 and review the diff.
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from biaslens.bias import ClickbaitDetector, NigerianContextAnalyzer
+from biaslens.patterns import analyze_all
+from biaslens.trust import TrustScoreCalculator
+
+
+GOLDEN_PATH = Path(__file__).parent / "golden" / "outputs.json"
+
+TEXTS = [
+    "",
+    "hi",
+    "urgent",
+    "The government announced new policies today regarding renewable energy.",
+    "BREAKING: Corrupt APC cabal has destroyed Nigeria!!! You won't believe what happened next",
+    "President Tinubu announced a new policy. The APC government said it will help.",
+    "Those greedy igbo traders and the yoruba agenda are ruining the south. Share this now before it's too late!",
+    "Peter Obi supporters gathered at the rally. Obi campaign said the labour party candidate is good and honest.",
+    "Fake Obi is a liar and a deceiver, terrible and evil. Useless labour party lies.",
+    "The backward north and primitive north people are lazy northerners. Arewa domination must end.",
+    "Muslim community and christian church leaders met in the north east to discuss peace.",
+    "kafir and infidel are words used by violent muslims. Nyamiri and gambari are slurs.",
+    "According to sources, experts say the scandal was a cover-up. What they don't want you to know: "
+    "the secret meeting was exposed.",
+    "This country is finished. Nawa o! Wetin be this? Na them. Dem no care about us. Wake up Nigeria!",
+    "10 reasons why you'll never guess what happens next. Doctors hate this one trick! SHOCKING!!!",
+    "Lagos residents shocked as Buhari finally reveals his hidden agenda. See what happened. "
+    "This Nigerian will amaze you.",
+    "My aboki friend is wonderful. Hausa culture and fulani people are amazing, excellent and brilliant.",
+    "Biafra terrorists and biafra criminals. Biafra war history. Former biafra.",
+    "Atiku Abubakar campaign: atiku said corrupt atiku? Failed buhari and clueless buhari.",
+    "Retweet if you agree! Tag your friends. Going viral, trending now, millions have seen this. Shared 500 times.",
+    "Heartbreaking and devastating news: you will cry. Prepare to be shocked. This will make you angry. "
+    "Breaking scandal revealed.",
+    "apc apc apc pdp pdp failed pdp pdp disaster evil pdp corrupt pdp",
+    "The southern states and south west governors. Going south. Greedy south? Cunning southerners.",
+    "obituary for obi's friend, obi-wan; tinubu's, APC's spokesperson said so.",
+    "Leaked document from an anonymous tip and a whistleblower: insider reveals research proves "
+    "studies show scientists confirm doctors warn.",
+    "Yoruba vs Igbo, christian vs muslim, religious war, ethnic cleansing, genocide, targeted killing, hausa vs fulani.",
+    "Number 7 will shock you. You need to see this incredible footage gone wrong. Viral video must see.",
+    "It is good, nice, solid, decent, okay and fair. The PDP statement was reasonable and acceptable.",
+    "Delete this before it's censored! Final warning, last chance, don't miss this, won't last long, "
+    "time sensitive, urgent.",
+    "North nigeria northern region north central from the north going north",
+    "Àwọn ará Èkó: BREAKING news, share this now! Ìjọba said wetin be this?",
+]
+
+# (bias_score, emotion_score, sentiment_label, emotion_data, sentiment_data, bias_data)
+TRUST_INPUTS = [
+    (0.1, 0.1, "neutral", None, None, None),
+    (0.9, 0.85, "negative", None, None, None),
+    (0.65, 0.45, "positive", None, None, None),
+    (0.5, 0.5, "neutral",
+     {"manipulation_risk": "minimal", "is_emotionally_charged": False},
+     {"label": "neutral"},
+     {"flag": False}),
+    (0.5, 0.5, "negative",
+     {"manipulation_risk": "high", "is_emotionally_charged": True},
+     {"bias_indicator": True, "is_polarized": True, "polarization_score": 0.8},
+     {"flag": True, "confidence": 0.9, "bias_level": "high",
+      "nigerian_detections": [{"term": "apc", "confidence": 0.9}, {"term": "pdp", "confidence": 0.8},
+                              {"term": "obi", "confidence": 0.1}],
+      "type_analysis": {"type": "political_bias"}}),
+    (0.5, 0.5, "neutral",
+     {"manipulation_risk": "medium"},
+     {"polarization_score": 0.75},
+     {"flag": True, "confidence": 0.65, "bias_level": "low"}),
+    (0.5, 0.5, "neutral",
+     {"is_emotionally_charged": True},
+     {"is_polarized": True},
+     {"flag": True, "confidence": 0.2, "bias_level": "low", "type_analysis": {"type": "neutral"}}),
+]
+
+
+def _plain(value):
+    """JSON-ready copy of value: enums by value, tuples as lists, floats rounded"""
+    if hasattr(value, "_asdict"):
+        value = value._asdict()
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, float):
+        return round(value, 6)
+    if hasattr(value, "value"):
+        return value.value
+    return value
+
+
+def _detection(detection):
+    return _plain({field: getattr(detection, field) for field in (
+        "term", "category", "bias_level", "confidence", "context", "bias_direction", "explanation"
+    )})
+
+
+def _trust(text, inputs):
+    bias_score, emotion_score, sentiment_label, emotion_data, sentiment_data, bias_data = inputs
+    score, indicator, explanation, tip, details = TrustScoreCalculator.calculate(
+        bias_score, emotion_score, sentiment_label, text,
+        emotion_data=emotion_data, sentiment_data=sentiment_data, bias_data=bias_data
+    )
+    if tip in TrustScoreCalculator.DID_YOU_KNOW_TIPS:
+        tip = "<general tip>"  # drawn at random
+    details = dict(details)
+    # The pattern analyses are pinned through analyze_all
+    del details["pattern_analysis"]
+    return _plain([score, indicator, explanation, tip, details])
+
+
+def _snapshot():
+    nigerian_analyzer = NigerianContextAnalyzer()
+    clickbait_detector = ClickbaitDetector()
+    outputs = []
+    for text in TEXTS:
+        clickbait = clickbait_detector.detect(text)
+        # detected_patterns is built from a set
+        clickbait["detected_patterns"] = sorted(clickbait["detected_patterns"])
+        outputs.append({
+            "text": text,
+            "analyze_all": _plain(analyze_all(text)),
+            "nigerian_context": [_detection(d) for d in nigerian_analyzer.analyze_text(text)],
+            "clickbait": _plain(clickbait),
+            "trust": [_trust(text, inputs) for inputs in TRUST_INPUTS],
+        })
+    return outputs
+
+
+def test_outputs_match_golden_file():
+    outputs = _snapshot()
+    if os.environ.get("BIASLENS_UPDATE_GOLDEN") == "1":
+        GOLDEN_PATH.write_text(json.dumps(outputs, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    expected = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+    assert [entry["text"] for entry in expected] == TEXTS
+    for actual, golden in zip(outputs, expected):
+        for key in ("analyze_all", "nigerian_context", "clickbait", "trust"):
+            assert actual[key] == golden[key], (actual["text"], key)
@@ -0,0 +1,129 @@
+import re
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+from biaslens.patterns import FakeNewsDetector, PatternEngine, ViralityDetector, _required_literal
+
+
+HEADLINE = "BREAKING: Doctors hate this one weird trick that every pharmacy in Lagos fears"
+
+
+def test_scan_reproduces_findall_per_family():
+    text = "BREAKING: the truth about the secret meeting! Share before they delete this, urgent. Experts say so."
+    scan = PatternEngine.scan(text)
+
+    for family, compiled, _ in PatternEngine.FAMILIES:
+        assert list(scan[family]) == compiled.findall(text)
+
+
+def test_fake_news_keeps_the_first_non_empty_group():
+    # Only grouped fake news patterns report a match; ungrouped ones (\bBreaking\b, ...) give all-empty tuples
+    detected, details = FakeNewsDetector.detect("Read the truth about the secret meeting in Abuja tonight")
+
+    assert detected is True
+    assert details["fake_matches"] == ["about", "meeting"]
+    assert FakeNewsDetector.detect(HEADLINE) == (False, {
+        "fake_matches": [], "credibility_flags": [], "fake_score": 0.0, "credibility_score": 0.0,
+        "risk_level": "minimal", "total_flags": 0
+    })
+
+
+def test_viral_matches_are_the_capture_group():
+    analysis = ViralityDetector.analyze_virality("Share before they delete this, urgent!")
+
+    assert analysis["viral_matches"] == ["before", "", ""]
+    assert analysis["manipulation_level"] == "high"
+
+
+def test_ascii_and_unicode_scans_agree():
+    text = "Shocking truth: the truth about it, share this now before it's too late"
+    accented = text + " café"
+
+    scan, accented_scan = PatternEngine._scan_uncached(text), PatternEngine._scan_uncached(accented)
+    for family, _, _ in PatternEngine.FAMILIES:
+        assert scan[family] == accented_scan[family]
+
+
+_CATEGORY_SAMPLES = {
+    sre_constants.CATEGORY_DIGIT: "7",
+    sre_constants.CATEGORY_WORD: "x",
+    sre_constants.CATEGORY_SPACE: " ",
+}
+
+
+def _set_samples(items):
+    samples = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            samples.append(chr(av))
+        elif op is sre_constants.RANGE:
+            samples.append(chr(av[0]))
+        elif op is sre_constants.CATEGORY:
+            samples.append(_CATEGORY_SAMPLES[av])
+        else:
+            raise NotImplementedError(op)
+    return samples
+
+
+def _samples(parsed):
+    """Strings the parsed pattern matches: every branch and set member, every repeat at its bounds"""
+    results = [""]
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            options = [chr(av)]
+        elif op is sre_constants.IN:
+            options = _set_samples(av)
+        elif op is sre_constants.BRANCH:
+            options = [sample for branch in av[1] for sample in _samples(branch)]
+        elif op is sre_constants.SUBPATTERN:
+            options = _samples(av[-1])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            low, high, sub = av
+            counts = {low, min(max(low, 1), high), min(low + 2, high)}
+            options = [sample * count for sample in _samples(sub) for count in sorted(counts)]
+        elif op is sre_constants.AT:
+            options = [""]
+        elif op is sre_constants.CATEGORY:
+            options = [_CATEGORY_SAMPLES[av]]
+        else:
+            raise NotImplementedError(op)
+        results = [result + option for result in results for option in options]
+    return results
+
+
+FAMILY_PATTERNS = [
+    (family, pattern) for family, _, patterns in PatternEngine.FAMILIES for pattern in patterns
+]
+
+
+@pytest.mark.parametrize("family, pattern", FAMILY_PATTERNS)
+def test_required_literal_occurs_in_every_positive_sample(family, pattern):
+    literal = _required_literal(pattern)
+    samples = _samples(sre_parse.parse(pattern))
+
+    assert samples
+    for sample in samples:
+        for variant in (sample, sample.upper(), sample.title()):
+            assert re.fullmatch(pattern, variant, re.IGNORECASE), (pattern, variant)
+            if literal is not None:
+                assert literal in variant.lower(), (pattern, literal, variant)
+
+
+@pytest.mark.parametrize("family, pattern", FAMILY_PATTERNS)
+def test_prefiltered_scan_finds_every_positive_sample(family, pattern):
+    compiled = dict((name, regex) for name, regex, _ in PatternEngine.FAMILIES)[family]
+    for sample in _samples(sre_parse.parse(pattern)):
+        for text in (f"Read this: {sample} today.", f"READ THIS: {sample.upper()} TODAY."):
+            expected = tuple(compiled.findall(text))
+
+            assert expected
+            assert PatternEngine._scan_uncached(text)[family] == expected
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from biaslens.trust import PatternAnalysis, TrustResult, TrustScoreCalculator
+
+
+TEXT = "BREAKING: the truth about the secret meeting, share this now before they delete it, you will cry"
+
+
+def test_trust_result_is_a_json_serializable_dict():
+    *_, details = TrustScoreCalculator.calculate(0.5, 0.5, "neutral", TEXT)
+
+    assert isinstance(details, TrustResult)
+    assert isinstance(details, dict)
+    assert "trust_level" in details
+    assert details["trust_level"] == details.trust_level
+    assert details.get("missing") is None
+    assert json.loads(json.dumps(details))["risk_factors"] == details.risk_factors
+
+
+def test_pattern_analysis_is_a_named_tuple():
+    *_, details = TrustScoreCalculator.calculate(0.5, 0.5, "neutral", TEXT)
+    analysis = details.pattern_analysis
+
+    assert isinstance(analysis, PatternAnalysis)
+    assert analysis.nigerian_patterns["has_triggers"] is True
+    assert analysis.fake_news_risk["risk_level"] == "high"
+    assert analysis.viral_manipulation["has_viral_patterns"] is True
+    assert set(analysis._asdict()) == {"nigerian_patterns", "fake_news_risk", "viral_manipulation"}
+
+
+def test_no_risk_factor_falls_back_to_a_general_tip():
+    assert TrustScoreCalculator._get_contextual_tip(0) in TrustScoreCalculator.DID_YOU_KNOW_TIPS
+
+
+def test_reload_tables_applies_edited_scoring_weights():
+    weights = TrustScoreCalculator.SCORING_WEIGHTS['fake_news']
+    original = weights['high_risk']
+    baseline = TrustScoreCalculator.calculate(0.0, 0.0, "neutral", TEXT)[4].deductions
+    try:
+        weights['high_risk'] = original + 10
+        TrustScoreCalculator.reload_tables()
+        deductions = TrustScoreCalculator.calculate(0.0, 0.0, "neutral", TEXT)[4].deductions
+    finally:
+        weights['high_risk'] = original
+        TrustScoreCalculator.reload_tables()
+
+    assert deductions[3] == baseline[3] + 10
+
+
+def test_reload_tables_applies_edited_trust_thresholds():
+    thresholds = TrustScoreCalculator.TRUST_THRESHOLDS
+    original = thresholds['trusted']
+    try:
+        thresholds['trusted'] = 80
+        TrustScoreCalculator.reload_tables()
+        level = TrustScoreCalculator.get_detailed_trust_level(75)
+    finally:
+        thresholds['trusted'] = original
+        TrustScoreCalculator.reload_tables()
+
+    assert level == 'moderate_caution'
+    assert TrustScoreCalculator.get_detailed_trust_level(75) == 'trusted'
+
+
+@pytest.mark.parametrize("text", ["", "hi", "SHOCKING!", "   urgent   "])
+def test_short_text_gets_the_neutral_insufficient_text_result(text):
+    score, indicator, explanation, tip, details = TrustScoreCalculator.calculate(0.9, 0.9, "negative", text)
+
+    assert score == 50
+    assert indicator == TrustScoreCalculator.get_trust_indicator(50)
+    assert explanation == ["Insufficient text for analysis."]
+    assert tip in TrustScoreCalculator.DID_YOU_KNOW_TIPS
+    assert details.trust_level == "high_caution"
+    assert details.risk_factors == []
+    assert details.deductions == [0.0] * 6
+    assert details.pattern_analysis.nigerian_patterns["total_flags"] == 0
+    assert details.pattern_analysis.fake_news_risk is None
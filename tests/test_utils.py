@@ -0,0 +1,75 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from biaslens import utils
+
+
+@pytest.fixture
+def tiny_classifier(tmp_path, monkeypatch):
+    """A small randomly initialised BERT classifier saved to disk, with its own cache dir"""
+    monkeypatch.setenv("BIASLENS_CACHE_DIR", str(tmp_path / "cache"))
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [f"w{i}" for i in range(50)]
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab))
+    tokenizer = transformers.BertTokenizerFast(vocab_file=str(vocab_file))
+    config = transformers.BertConfig(
+        vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2, num_attention_heads=2,
+        intermediate_size=37, max_position_embeddings=utils.TORCHSCRIPT_MAX_LENGTH, num_labels=3
+    )
+    torch.manual_seed(0)
+    model = transformers.BertForSequenceClassification(config).eval()
+    model_dir = tmp_path / "model"
+    model.save_pretrained(model_dir)
+    return str(model_dir), tokenizer, model
+
+
+def _encode(tokenizer, texts):
+    # The same call the classifiers make
+    return tokenizer(texts, return_tensors="pt", truncation=True, max_length=512, padding=True)
+
+
+@pytest.mark.parametrize("words", [5, 100, 300, 600])
+def test_traced_logits_match_eager_across_lengths(tiny_classifier, words):
+    model_dir, tokenizer, model = tiny_classifier
+    texts = [" ".join(f"w{i % 50}" for i in range(words)), "w1 w2 w3"]
+    inputs = _encode(tokenizer, texts)
+
+    with torch.no_grad():
+        eager = model(input_ids=inputs["input_ids"], attention_mask=inputs["attention_mask"]).logits
+        first = utils.load_torchscript_classifier(model_dir, tokenizer)(**inputs).logits
+        # The second load comes from the saved trace
+        reloaded = utils.load_torchscript_classifier(model_dir, tokenizer)(**inputs).logits
+
+    assert torch.allclose(first, eager, atol=1e-4)
+    assert torch.allclose(reloaded, eager, atol=1e-4)
+
+
+def test_torchscript_path_depends_on_torch_version_and_int8(monkeypatch):
+    path = utils.torchscript_path("some/model")
+
+    assert utils.torchscript_path("some/model", quantized=True) != path
+    monkeypatch.setattr(torch, "__version__", "0.0.0")
+    assert utils.torchscript_path("some/model") != path
+
+
+def test_load_sequence_classifier_caches_per_variant(tiny_classifier, monkeypatch):
+    model_dir, tokenizer, _ = tiny_classifier
+    tokenizer.save_pretrained(model_dir)
+    monkeypatch.setattr(utils, "_model_cache", {})
+    model_class = transformers.BertForSequenceClassification
+
+    key, entry = utils.load_sequence_classifier(model_class, model_dir)
+    assert key == model_dir
+    assert isinstance(entry["model"], model_class)
+    assert entry["device"] in ("cpu", "cuda")
+    assert utils.load_sequence_classifier(model_class, model_dir)[1] is entry
+
+    traced_key, traced = utils.load_sequence_classifier(model_class, model_dir, use_torchscript=True)
+    assert traced_key == f"{model_dir}::torchscript"
+    assert isinstance(traced["model"], utils.TorchScriptClassifier)
+
+    monkeypatch.setenv("BIASLENS_INT8", "1")
+    assert utils.load_sequence_classifier(model_class, model_dir, use_torchscript=True)[0] \
+        == f"{model_dir}::torchscript::int8"